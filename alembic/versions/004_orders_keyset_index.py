@@ -0,0 +1,25 @@
+"""Add (tenant_id, id) index on orders for keyset pagination.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:00.000000
+
+The orders primary key is (id, tenant_id), which cannot serve the
+`WHERE tenant_id = :t AND id > :after_id ORDER BY id` seek used by
+GET /api/v1/orders?after_id=... . Leading with tenant_id makes the
+cursor query an index range scan regardless of page depth.
+"""
+from alembic import op
+
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_orders_tenant_id_id', 'orders', ['tenant_id', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_orders_tenant_id_id', 'orders')
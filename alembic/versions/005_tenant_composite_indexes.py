@@ -0,0 +1,52 @@
+"""Add tenant-leading composite indexes for driver joins and route history.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:00.000000
+
+- orders (tenant_id, driver_id, status): every driver view joins
+  `o.driver_id = d.id AND o.tenant_id = d.tenant_id` and usually filters
+  on status; the existing idx_orders_driver covers driver_id alone.
+- route_plans (tenant_id, order_id, created_at): GET /routes/{order_id}/current
+  and /history filter on tenant and order and sort by created_at, which
+  idx_route_plans_order can only partially serve.
+
+Indexes are built CONCURRENTLY so the upgrade does not block writes to
+live tables; that requires running outside the migration transaction.
+"""
+from alembic import op
+
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_orders_tenant_driver_status',
+            'orders',
+            ['tenant_id', 'driver_id', 'status'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_route_plans_tenant_order_time',
+            'route_plans',
+            ['tenant_id', 'order_id', 'created_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_route_plans_tenant_order_time',
+            'route_plans',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_orders_tenant_driver_status',
+            'orders',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,60 @@
+"""Add partial indexes over open (non-completed) orders.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:00.000000
+
+Nearly every operational view only looks at orders that are not yet
+completed, while completed orders make up the bulk of the table over time:
+
+- orders (tenant_id, driver_id) WHERE status <> 'completed': the driver
+  list/detail/stats views and fleet analytics join each driver to its
+  open orders (`o.status <> 'completed'`).
+- orders (tenant_id, current_risk_score) WHERE status <> 'completed': the
+  copilot high-risk order context and high-risk counts filter open orders
+  by risk score and sort by it.
+
+Partial indexes only hold the open rows, so they stay small and hot in
+cache as the completed history grows. Built CONCURRENTLY, like 005.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+_OPEN_ORDERS = sa.text("status <> 'completed'")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_orders_open_tenant_driver',
+            'orders',
+            ['tenant_id', 'driver_id'],
+            postgresql_where=_OPEN_ORDERS,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_orders_open_tenant_risk',
+            'orders',
+            ['tenant_id', 'current_risk_score'],
+            postgresql_where=_OPEN_ORDERS,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_orders_open_tenant_risk',
+            'orders',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_orders_open_tenant_driver',
+            'orders',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,30 @@
+"""Generate surrogate ids in the database for append-only tables.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 00:00:00.000000
+
+route_plans, predictions and agent_decisions rows are identified by a
+random UUID that no caller ever chooses. Defaulting the id column to
+gen_random_uuid() (built in since PostgreSQL 13, already used by the
+route_plans writers) lets bulk inserts omit it instead of generating and
+shipping one per row from Python. Columns stay TEXT like every other id.
+"""
+from alembic import op
+
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+_TABLES = ('route_plans', 'predictions', 'agent_decisions')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()::text")
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,43 @@
+"""Add (tenant_id, driver_id, recorded_at) index on gps_events.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 00:00:00.000000
+
+The driver list and driver detail views fetch each driver's latest GPS
+fix with a LATERAL subquery:
+
+    WHERE ge.driver_id = d.id AND ge.tenant_id = d.tenant_id
+    ORDER BY ge.recorded_at DESC LIMIT 1
+
+gps_events is only indexed by (order_id, recorded_at) and
+(tenant_id, recorded_at), so each lateral probe walks the tenant's
+recent events until it finds the driver. With driver_id in the key the
+probe becomes a single backwards index seek per driver. gps_events is the
+highest-volume table, so the index is built CONCURRENTLY like 005.
+"""
+from alembic import op
+
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_gps_tenant_driver_time',
+            'gps_events',
+            ['tenant_id', 'driver_id', 'recorded_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_gps_tenant_driver_time',
+            'gps_events',
+            postgresql_concurrently=True,
+        )
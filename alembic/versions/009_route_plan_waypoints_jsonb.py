@@ -0,0 +1,40 @@
+"""Store route_plans.waypoints as JSONB.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16 00:00:00.000000
+
+waypoints holds the solved stop sequence (the route geometry) and is by
+far the largest column on route_plans. As TEXT it is opaque to
+PostgreSQL: nothing validates it on write and any server-side use has to
+re-parse the whole document. JSONB is stored pre-parsed and is checked
+once at insert time. Writers keep binding json.dumps() strings, which
+PostgreSQL casts on insert; readers already accept either a JSON string
+or a decoded list.
+
+No GIN index: nothing filters on waypoint contents today.
+ALTER COLUMN TYPE rewrites the table under an exclusive lock; route_plans
+is append-only and small relative to gps_events.
+"""
+from alembic import op
+
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE route_plans ALTER COLUMN waypoints DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE route_plans ALTER COLUMN waypoints TYPE jsonb USING waypoints::jsonb"
+    )
+    op.execute("ALTER TABLE route_plans ALTER COLUMN waypoints SET DEFAULT '[]'::jsonb")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE route_plans ALTER COLUMN waypoints DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE route_plans ALTER COLUMN waypoints TYPE text USING waypoints::text"
+    )
+    op.execute("ALTER TABLE route_plans ALTER COLUMN waypoints SET DEFAULT '[]'")
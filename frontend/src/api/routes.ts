@@ -42,7 +42,7 @@ export interface RouteHistoryEntry {
   route_plan_id: string
   order_id: string
   created_at: string
-  waypoints: any
+  waypoints?: any
   total_distance_km: number
   total_duration_minutes: number
   solver_status: string
@@ -65,7 +65,9 @@ export const routesAPI = {
     return apiClient.get<RouteResponse>(`/routes/${orderId}/current`)
   },
 
-  async getRouteHistory(orderId: string): Promise<RouteHistoryEntry[]> {
-    return apiClient.get<RouteHistoryEntry[]>(`/routes/${orderId}/history`)
+  async getRouteHistory(orderId: string, includeWaypoints = true): Promise<RouteHistoryEntry[]> {
+    return apiClient.get<RouteHistoryEntry[]>(`/routes/${orderId}/history`, {
+      params: { include_waypoints: includeWaypoints },
+    })
   },
 }
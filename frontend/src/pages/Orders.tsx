@@ -194,7 +194,7 @@ function InvestigationWorkspace({
   })
   const historyQuery = useQuery({
     queryKey: ['route', 'history', orderId],
-    queryFn: () => routesAPI.getRouteHistory(orderId!),
+    queryFn: () => routesAPI.getRouteHistory(orderId!, false),
     enabled: !!orderId,
     staleTime: 30000,
   })
@@ -13,7 +13,6 @@ import asyncio
 import hashlib
 import os
 import random
-import uuid
 from datetime import datetime, timedelta
 
 from sqlalchemy import text
@@ -77,25 +76,27 @@ async def seed() -> None:
         )
 
         # ------------------------------------------------------------------ #
-        # Drivers — upsert                                                     #
+        # Drivers — one multi-row upsert                                       #
         # ------------------------------------------------------------------ #
-        for d in DEMO_DRIVER_IDS:
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO drivers (id, tenant_id, name, historical_on_time_rate, total_deliveries)
-                    VALUES (:id, :tid, :n, :r, :del)
-                    ON CONFLICT (id, tenant_id) DO NOTHING
-                    """
-                ),
+        await conn.execute(
+            text(
+                """
+                INSERT INTO drivers (id, tenant_id, name, historical_on_time_rate, total_deliveries)
+                VALUES (:id, :tid, :n, :r, :del)
+                ON CONFLICT (id, tenant_id) DO NOTHING
+                """
+            ),
+            [
                 {
                     "id": d,
                     "tid": DEV_TENANT_ID,
                     "n": f"Driver {d}",
                     "r": round(random.uniform(0.7, 0.98), 2),
                     "del": random.randint(10, 200),
-                },
-            )
+                }
+                for d in DEMO_DRIVER_IDS
+            ],
+        )
 
         # ------------------------------------------------------------------ #
         # Orders — only insert missing ones (idempotent)                       #
@@ -106,7 +107,14 @@ async def seed() -> None:
         )
         existing_orders: set[str] = {row[0] for row in existing_rows}
 
-        seeded = 0
+        # Build every row up front, then write each table with a single
+        # executemany (batched into multi-row INSERTs by the driver) instead of
+        # four round-trips per order. Child-row ids come from the column
+        # default (gen_random_uuid(), migration 007).
+        order_rows: list[dict] = []
+        route_plan_rows: list[dict] = []
+        prediction_rows: list[dict] = []
+        decision_rows: list[dict] = []
         for o in DEMO_ORDER_IDS:
             if o in existing_orders:
                 continue
@@ -117,17 +125,7 @@ async def seed() -> None:
             risk = round(random.uniform(0, 1), 4)
             eta = datetime.utcnow() + timedelta(hours=random.randint(1, 48))
 
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO orders
-                        (id, tenant_id, driver_id, status, planned_stops,
-                         completed_stops, planned_eta, current_risk_score)
-                    VALUES
-                        (:id, :tid, :did, :s, :st, :co, :eta, :r)
-                    ON CONFLICT (id, tenant_id) DO NOTHING
-                    """
-                ),
+            order_rows.append(
                 {
                     "id": o,
                     "tid": DEV_TENANT_ID,
@@ -137,34 +135,22 @@ async def seed() -> None:
                     "co": random.randint(0, st),
                     "eta": eta,
                     "r": risk,
-                },
+                }
             )
 
             # route_plan for this order
-            rpid = str(uuid.uuid4())
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO route_plans
-                        (id, order_id, tenant_id, waypoints,
-                         total_distance_km, total_duration_minutes, solver_status)
-                    VALUES (:id, :oid, :tid, :w, :dist, :dur, :status)
-                    ON CONFLICT (id, tenant_id) DO NOTHING
-                    """
-                ),
+            route_plan_rows.append(
                 {
-                    "id": rpid,
                     "oid": o,
                     "tid": DEV_TENANT_ID,
                     "w": "[]",
                     "dist": round(random.uniform(5, 50), 1),
                     "dur": round(random.uniform(15, 120), 1),
                     "status": "solved",
-                },
+                }
             )
 
             # prediction for this order
-            prid = str(uuid.uuid4())
             factors = random.choice(
                 [
                     '[{"feature":"traffic_congestion"},{"feature":"weather_delay"},{"feature":"driver_availability"}]',
@@ -174,18 +160,8 @@ async def seed() -> None:
                     '[{"feature":"weather_delay"},{"feature":"road_closure"},{"feature":"detour_required"}]',
                 ]
             )
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO predictions
-                        (id, order_id, tenant_id, risk_score, is_high_risk,
-                         confidence, top_risk_factors, predicted_delay_minutes, model_version)
-                    VALUES (:id, :oid, :tid, :r, :high, :conf, :factors, :delay, :mv)
-                    ON CONFLICT (id) DO NOTHING
-                    """
-                ),
+            prediction_rows.append(
                 {
-                    "id": prid,
                     "oid": o,
                     "tid": DEV_TENANT_ID,
                     "r": risk,
@@ -194,23 +170,12 @@ async def seed() -> None:
                     "factors": factors,
                     "delay": round(random.uniform(0, 30), 1),
                     "mv": "1.0.0",
-                },
+                }
             )
 
             # agent_decision for this order
-            adid = str(uuid.uuid4())
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO agent_decisions
-                        (id, order_id, tenant_id, risk_score, decision,
-                         reasoning, tools_called, outcome, model_version)
-                    VALUES (:id, :oid, :tid, :r, :dec, :rea, :tools, :out, :mv)
-                    ON CONFLICT (id) DO NOTHING
-                    """
-                ),
+            decision_rows.append(
                 {
-                    "id": adid,
                     "oid": o,
                     "tid": DEV_TENANT_ID,
                     "r": risk,
@@ -219,10 +184,58 @@ async def seed() -> None:
                     "tools": "[]",
                     "out": "success",
                     "mv": "1.0.0",
-                },
+                }
+            )
+
+        if order_rows:
+            await conn.execute(
+                text(
+                    """
+                    INSERT INTO orders
+                        (id, tenant_id, driver_id, status, planned_stops,
+                         completed_stops, planned_eta, current_risk_score)
+                    VALUES
+                        (:id, :tid, :did, :s, :st, :co, :eta, :r)
+                    ON CONFLICT (id, tenant_id) DO NOTHING
+                    """
+                ),
+                order_rows,
+            )
+            await conn.execute(
+                text(
+                    """
+                    INSERT INTO route_plans
+                        (order_id, tenant_id, waypoints,
+                         total_distance_km, total_duration_minutes, solver_status)
+                    VALUES (:oid, :tid, :w, :dist, :dur, :status)
+                    """
+                ),
+                route_plan_rows,
+            )
+            await conn.execute(
+                text(
+                    """
+                    INSERT INTO predictions
+                        (order_id, tenant_id, risk_score, is_high_risk,
+                         confidence, top_risk_factors, predicted_delay_minutes, model_version)
+                    VALUES (:oid, :tid, :r, :high, :conf, :factors, :delay, :mv)
+                    """
+                ),
+                prediction_rows,
+            )
+            await conn.execute(
+                text(
+                    """
+                    INSERT INTO agent_decisions
+                        (order_id, tenant_id, risk_score, decision,
+                         reasoning, tools_called, outcome, model_version)
+                    VALUES (:oid, :tid, :r, :dec, :rea, :tools, :out, :mv)
+                    """
+                ),
+                decision_rows,
             )
 
-            seeded += 1
+        seeded = len(order_rows)
 
         print(
             f"Seed complete: tenant={DEV_TENANT_ID!r}, drivers={len(DEMO_DRIVER_IDS)}, "
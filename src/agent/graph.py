@@ -191,6 +191,7 @@ async def node_compute_features(state: AgentGraphState) -> AgentGraphState:
             0.0,
         )
 
+        now = datetime.now(timezone.utc)
         features = feature_builder.build_from_live(
             {
                 "order_id": order_state.order_id,
@@ -200,12 +201,12 @@ async def node_compute_features(state: AgentGraphState) -> AgentGraphState:
                 "actual_duration_so_far_minutes": actual_duration_so_far_minutes,
                 "stops_remaining": order_state.planned_stops - order_state.completed_stops,
                 "eta_minutes_remaining": (
-                    (order_state.current_eta - datetime.now(timezone.utc)).total_seconds() / 60
+                    (order_state.current_eta - now).total_seconds() / 60
                 ),
                 "speed": order_state.current_speed_kmh,
                 "deviation_meters": order_state.route_deviation_meters,
-                "hour_of_day": datetime.now(timezone.utc).hour,
-                "day_of_week": datetime.now(timezone.utc).weekday(),
+                "hour_of_day": now.hour,
+                "day_of_week": now.weekday(),
             },
             driver_stats,
         )
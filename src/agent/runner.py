@@ -118,11 +118,17 @@ class AgentRunner:
             self.redis = await Redis.from_url(self.redis_url, decode_responses=False)
             
             # PostgreSQL
-            self.db_engine = create_async_engine(self.db_url)
+            self.db_engine = create_async_engine(
+                self.db_url, pool_pre_ping=True, pool_recycle=3600
+            )
             self.db_session_factory = async_sessionmaker(self.db_engine, class_=AsyncSession)
             
-            # HTTP client
-            self.http_client = httpx.AsyncClient(timeout=10.0)
+            # HTTP client, shared by every tool call so connections to the
+            # optimizer and webhook hosts are kept alive between events.
+            self.http_client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
             
             # Agent graph
             self.graph = build_agent_graph()
@@ -206,28 +212,37 @@ class AgentRunner:
             if not messages:
                 return
             
-            # Process each message
+            # Process each message; successes are acknowledged together below
+            processed_ids = []
             for stream_name, event_list in messages:
                 for message_id, event_data in event_list:
                     try:
-                        await self.process_event(message_id, event_data)
+                        final_state = await self.process_event(message_id, event_data, ack=False)
+                        if final_state is not None:
+                            processed_ids.append(message_id)
                     except Exception as e:
                         logger.error(
                             "event_processing_error",
                             message_id=message_id,
                             error=str(e),
                         )
+            
+            # One XACK for the whole batch instead of a round-trip per event
+            if processed_ids:
+                await self.redis.xack("gps_pings", "delay_agent", *processed_ids)
         
         except Exception as e:
             logger.error("batch_read_failed", error=str(e))
     
-    async def process_event(self, message_id: bytes, event_data: dict) -> Optional[dict]:
+    async def process_event(self, message_id: bytes, event_data: dict, ack: bool = True) -> Optional[dict]:
         """
         Process one GPS event through the agent graph.
         
         Args:
             message_id: Redis stream message ID
             event_data: Raw event data from Redis
+            ack: Acknowledge the message on success. process_batch passes
+                 False and acknowledges the whole batch in one call.
             
         Returns:
             Final agent state if successful
@@ -302,7 +317,8 @@ class AgentRunner:
                 EVENTS_PROCESSED.labels(tenant_id=tenant_id, status="success").inc()
                 
                 # Acknowledge the event
-                await self.redis.xack("gps_pings", "delay_agent", message_id)
+                if ack:
+                    await self.redis.xack("gps_pings", "delay_agent", message_id)
                 
                 logger.info(
                     "event_processed",
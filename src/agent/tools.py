@@ -8,18 +8,25 @@ Each tool has side effects and must be robust:
 - Type-safe inputs/outputs
 """
 
-from dataclasses import dataclass
-from datetime import datetime, timezone, timedelta
 import json
-from typing import Optional, Any
-import structlog
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
 import httpx
+import structlog
 from redis.asyncio import Redis
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-import math
+
+from src.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Resolved once at import; the optimizer URL does not change at runtime.
+_ROUTE_OPTIMIZER_URL = f"{get_settings(allow_defaults=True).route_optimizer_url}/optimize"
+
 
 # ===== Response Models =====
 
@@ -83,8 +90,7 @@ async def call_route_optimizer(
             "remaining_stops": remaining_stops,
         }
         
-        # Call optimizer service (mocked URL - replace with real endpoint)
-        optimizer_url = "http://route-optimizer:8080/optimize"
+        optimizer_url = _ROUTE_OPTIMIZER_URL
         
         try:
             response = await http_client.post(
@@ -308,12 +314,19 @@ async def update_order_eta(
     """
     try:
         # === Update in PostgreSQL ===
+        # RETURNING hands back the owning tenant in the same round trip, so the
+        # event below needs no separate tenant lookup.
         result = await db_session.execute(
-            "UPDATE orders SET actual_eta = :eta, updated_at = :now WHERE id = :order_id",
+            text("""
+                UPDATE orders SET actual_eta = :eta, updated_at = :now
+                WHERE id = :order_id
+                RETURNING tenant_id
+            """),
             {"eta": new_eta, "now": datetime.now(timezone.utc), "order_id": order_id},
         )
+        tenant_id = result.scalar_one_or_none()
         
-        if result.rowcount == 0:
+        if tenant_id is None:
             logger.warning(
                 "order_not_found_for_eta_update",
                 order_id=order_id,
@@ -330,13 +343,8 @@ async def update_order_eta(
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
         
-        # Get tenant_id for scoped pub/sub
-        # In production, this would come from the order query result
-        tenant_key = f"order_tenant:{order_id}"
-        tenant_id = await redis_client.get(tenant_key)
-        
         if tenant_id:
-            tenant_id = tenant_id.decode() if isinstance(tenant_id, bytes) else tenant_id
+            tenant_id = str(tenant_id)
             channel = f"tenant:{tenant_id}:eta_updated"
             await redis_client.publish(channel, json.dumps(event_payload))
 
@@ -436,7 +444,6 @@ async def write_audit_log(
 
         if redis_client is not None:
             from src.db.redis_schema import get_agent_updates_channel, get_pubsub_events_channel
-            import json
 
             await redis_client.publish(
                 get_agent_updates_channel(),
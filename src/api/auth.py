@@ -12,6 +12,7 @@ Migration note:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -19,6 +20,7 @@ from typing import Optional
 
 import bcrypt
 import structlog
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
@@ -35,6 +37,18 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Tenants confirmed active, so authenticated requests skip the tenants lookup.
+# Only positive results are cached: a deactivated tenant is locked out within
+# TENANT_ACTIVE_CACHE_TTL_SECONDS, and unknown/inactive tenants always re-query.
+TENANT_ACTIVE_CACHE_TTL_SECONDS = 30
+_active_tenants: TTLCache = TTLCache(maxsize=4096, ttl=TENANT_ACTIVE_CACHE_TTL_SECONDS)
+
+# Decoded access-token payloads keyed by a keyed hash of the token, so repeat
+# requests with the same bearer token skip the HMAC + base64 decode. Hits are
+# re-checked against `exp`; failed decodes are never cached.
+TOKEN_DECODE_CACHE_TTL_SECONDS = 60
+_decoded_tokens: TTLCache = TTLCache(maxsize=4096, ttl=TOKEN_DECODE_CACHE_TTL_SECONDS)
+
 
 class AuthenticatedTenant(BaseModel):
     """Authenticated tenant from JWT or API key."""
@@ -47,9 +61,15 @@ class AuthenticatedTenant(BaseModel):
 # Password hashing (bcrypt)
 # ---------------------------------------------------------------------------
 
+# Cost factor for new hashes. Verification always uses the rounds embedded in
+# the stored hash, so changing this only affects passwords set afterwards.
+BCRYPT_ROUNDS = 12
+
+
 def hash_password(password: str) -> str:
     """Hash a password with bcrypt (auto-generates salt)."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -60,6 +80,15 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
 
+async def averify_password(password: str, password_hash: str) -> bool:
+    """
+    verify_password for async handlers.
+    bcrypt is deliberately slow (~250ms at 12 rounds) and releases the GIL,
+    so it runs in a worker thread instead of stalling the event loop.
+    """
+    return await asyncio.to_thread(verify_password, password, password_hash)
+
+
 # ---------------------------------------------------------------------------
 # API key hashing (SHA-256 — acceptable for server-generated keys)
 # ---------------------------------------------------------------------------
@@ -89,6 +118,28 @@ def _get_secret_key() -> str:
 # Access token (short-lived JWT)
 # ---------------------------------------------------------------------------
 
+def _decode_token_cached(token: str, secret: str) -> dict:
+    """
+    jwt.decode with a short-lived cache of successful results.
+    The cache key is blake2b keyed with the secret, so rotating SECRET_KEY
+    never serves payloads verified under the old key. Raises JWTError like
+    jwt.decode on invalid or expired tokens.
+    """
+    key = hashlib.blake2b(
+        token.encode("utf-8"), digest_size=16, key=secret.encode("utf-8")[:64]
+    ).digest()
+    payload = _decoded_tokens.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > datetime.now(timezone.utc).timestamp():
+            return payload
+        _decoded_tokens.pop(key, None)
+
+    payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
+    _decoded_tokens[key] = payload
+    return payload
+
+
 def create_access_token(
     tenant_id: str,
     name: str,
@@ -101,13 +152,13 @@ def create_access_token(
     secret = _get_secret_key()
     if expires_delta is None:
         expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    expire = datetime.now(timezone.utc) + expires_delta
+    now = datetime.now(timezone.utc)
     payload = {
         "sub": tenant_id,
         "name": name,
         "type": "access",
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + expires_delta,
+        "iat": now,
     }
     token = jwt.encode(payload, secret, algorithm=ALGORITHM)
     logger.info("access_token_created", tenant_id=tenant_id)
@@ -126,14 +177,14 @@ async def create_refresh_token(tenant_id: str, name: str) -> tuple[str, str]:
     """
     secret = _get_secret_key()
     jti = str(uuid.uuid4())
-    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    now = datetime.now(timezone.utc)
     payload = {
         "sub": tenant_id,
         "name": name,
         "type": "refresh",
         "jti": jti,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        "iat": now,
     }
     token = jwt.encode(payload, secret, algorithm=ALGORITHM)
 
@@ -168,6 +219,41 @@ async def is_refresh_token_revoked(jti: str) -> bool:
 # Access token verification
 # ---------------------------------------------------------------------------
 
+async def _ensure_tenant_active(db: AsyncSession, tenant_id: str) -> None:
+    """Verify the tenant exists and is active, consulting the TTL cache first."""
+    if tenant_id in _active_tenants:
+        return
+
+    try:
+        result = await db.execute(
+            text("SELECT is_active FROM tenants WHERE id = :tenant_id"),
+            {"tenant_id": tenant_id},
+        )
+        row = result.one_or_none()
+        if row is None:
+            logger.warning("tenant_not_found", tenant_id=tenant_id)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Tenant not found",
+            )
+        if not row[0]:
+            logger.warning("tenant_inactive", tenant_id=tenant_id)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Tenant account is inactive",
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("tenant_verification_failed", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service unavailable",
+        )
+
+    _active_tenants[tenant_id] = True
+
+
 async def get_current_tenant(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
@@ -199,7 +285,7 @@ async def get_current_tenant(
     token = credentials.credentials
 
     try:
-        payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
+        payload = _decode_token_cached(token, secret)
         token_type: str | None = payload.get("type")
         if token_type != "access":
             logger.warning("token_invalid", reason="not_an_access_token")
@@ -222,33 +308,7 @@ async def get_current_tenant(
             detail="Invalid or expired token",
         )
 
-    # Verify tenant exists and is active
-    try:
-        result = await db.execute(
-            text("SELECT is_active FROM tenants WHERE id = :tenant_id"),
-            {"tenant_id": tenant_id},
-        )
-        row = result.one_or_none()
-        if row is None:
-            logger.warning("tenant_not_found", tenant_id=tenant_id)
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Tenant not found",
-            )
-        if not row[0]:
-            logger.warning("tenant_inactive", tenant_id=tenant_id)
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Tenant account is inactive",
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("tenant_verification_failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Authentication service unavailable",
-        )
+    await _ensure_tenant_active(db, tenant_id)
 
     request.state.tenant_id = tenant_id
     structlog.contextvars.bind_contextvars(tenant_id=tenant_id)
@@ -353,7 +413,7 @@ async def get_current_tenant_ws(
             detail="Missing WebSocket authentication token",
         )
     try:
-        payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
+        payload = _decode_token_cached(token, secret)
         token_type: str | None = payload.get("type")
         if token_type != "access":
             logger.warning("ws_auth_invalid_type")
@@ -25,7 +25,13 @@ _engine = None
 _async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
 
-def _get_session_maker() -> async_sessionmaker[AsyncSession]:
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Return the application's pooled session factory, creating it on first use.
+
+    For code outside a request (background jobs, schedulers, WebSocket
+    handlers) that needs the same engine as get_db.
+    """
     global _engine, _async_session_maker
 
     if _async_session_maker is None:
@@ -35,8 +41,8 @@ def _get_session_maker() -> async_sessionmaker[AsyncSession]:
             DATABASE_URL,
             echo=False,
             pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            pool_size=_settings.db_pool_size,
+            max_overflow=_settings.db_max_overflow,
             pool_recycle=3600,
         )
         _async_session_maker = async_sessionmaker(
@@ -48,6 +54,16 @@ def _get_session_maker() -> async_sessionmaker[AsyncSession]:
     return _async_session_maker
 
 
+async def dispose_engine() -> None:
+    """Close the pooled connections, e.g. on application shutdown."""
+    global _engine, _async_session_maker
+
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _async_session_maker = None
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for database session.
@@ -55,7 +71,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession
     """
-    async_session_maker = _get_session_maker()
+    async_session_maker = get_session_maker()
 
     async with async_session_maker() as session:
         try:
@@ -129,10 +145,22 @@ _real_redis_works: bool = False
 _prediction_service_instance: PredictionService | None = None
 
 
+def set_prediction_service(service: PredictionService) -> None:
+    """
+    Install the instance loaded during application startup as the singleton.
+
+    Without this the lifespan hook and the first request would each load
+    their own copy of the model artefacts.
+    """
+    global _prediction_service_instance
+    _prediction_service_instance = service
+
+
 async def get_prediction_service() -> PredictionService:
     """
     Get prediction service singleton.
     Uses a module-level cached instance to avoid reloading the model on every request.
+    Normally seeded at startup via set_prediction_service().
 
     Returns:
         PredictionService singleton
@@ -15,11 +15,11 @@ from typing import Callable
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy import text
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from src.api.deps import get_db, get_redis
+from src.api.deps import dispose_engine, get_db, get_redis, get_session_maker, set_prediction_service
 from src.api.routers import (
     agent,
     agent_ops,
@@ -42,6 +42,7 @@ from src.core.metrics import (
     http_requests_total,
 )
 from src.core.config import get_settings
+from src.core.log_config import configure_logging
 from src.ml.inference import PredictionService
 from src.api.rate_limit import check_rate_limit
 from src.services.executive_summary import ExecutiveSummaryService, SummaryType
@@ -49,6 +50,10 @@ from src.services.context_builder import ContextBuilder
 
 logger = structlog.get_logger(__name__)
 
+# How long shutdown waits for cancelled background tasks to unwind before
+# moving on to closing Redis and the database pool.
+SHUTDOWN_TASK_TIMEOUT_SECONDS = 5.0
+
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Adds security headers to all responses."""
@@ -117,6 +122,10 @@ async def lifespan(app: FastAPI):
     Startup: Initialize services, verify connections.
     Shutdown: Gracefully close connections.
     """
+    configure_logging(
+        os.getenv("ENVIRONMENT", "development"),
+        os.getenv("LOG_LEVEL", "INFO"),
+    )
     logger.info("startup", step="IntelliLog-AI API starting")
     skip_external_checks = os.getenv("SKIP_EXTERNAL_STARTUP_CHECKS", "false").lower() == "true"
 
@@ -128,7 +137,10 @@ async def lifespan(app: FastAPI):
         logger.info("startup", step="loading_ml_model")
         prediction_service = PredictionService(model_dir="models/")
         app.state.prediction_service = prediction_service
+        set_prediction_service(prediction_service)
         logger.info("startup", step="ml_model_loaded")
+        warm_up_ms = prediction_service.warm_up()
+        logger.info("startup", step="ml_model_warmed", latency_ms=round(warm_up_ms, 2))
 
         if skip_external_checks:
             logger.warning(
@@ -174,21 +186,21 @@ async def lifespan(app: FastAPI):
         async def _run_summary_scheduler():
             while True:
                 try:
-                    async for db in get_db():
-                        try:
-                            redis_client = await get_redis()
-                            ctx_builder = ContextBuilder(db, redis_client)
-                            summary_service = ExecutiveSummaryService(db)
-                            for tenant_id in ["default"]:
-                                try:
-                                    ctx = await ctx_builder.build(tenant_id)
-                                    context_text = ctx_builder.context_to_prompt_text(ctx)
-                                    await summary_service.generate_all_types(tenant_id, context_text)
-                                except Exception as te:
-                                    logger.warning("summary_tenant_skipped", tenant_id=tenant_id, error=str(te))
-                            await redis_client.close()
-                        finally:
-                            await db.close()
+                    # The session context returns the connection to the pool
+                    # even when shutdown cancels the task mid-iteration.
+                    async with get_session_maker()() as db:
+                        # Shared app-wide client: closing it here would tear
+                        # down the pool every request handler is using.
+                        redis_client = await get_redis()
+                        ctx_builder = ContextBuilder(db, redis_client)
+                        summary_service = ExecutiveSummaryService(db)
+                        for tenant_id in ["default"]:
+                            try:
+                                ctx = await ctx_builder.build(tenant_id)
+                                context_text = ctx_builder.context_to_prompt_text(ctx)
+                                await summary_service.generate_all_types(tenant_id, context_text)
+                            except Exception as te:
+                                logger.warning("summary_tenant_skipped", tenant_id=tenant_id, error=str(te))
                 except Exception as se:
                     logger.error("summary_scheduler_error", error=str(se))
                 await asyncio.sleep(900)  # 15 minutes
@@ -198,13 +210,17 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Cancel summary scheduler
+    # Cancel summary scheduler. Bounded so a task stuck in a slow call cannot
+    # hold up shutdown (asyncio.wait, unlike wait_for, never re-awaits it).
     if summary_task:
         summary_task.cancel()
-        try:
-            await summary_task
-        except asyncio.CancelledError:
-            pass
+        _, pending = await asyncio.wait({summary_task}, timeout=SHUTDOWN_TASK_TIMEOUT_SECONDS)
+        if pending:
+            logger.warning(
+                "shutdown",
+                step="summary_scheduler_cancel_timeout",
+                timeout_seconds=SHUTDOWN_TASK_TIMEOUT_SECONDS,
+            )
 
     # Shutdown
     logger.info("shutdown", step="IntelliLog-AI API shutting down")
@@ -212,6 +228,8 @@ async def lifespan(app: FastAPI):
         if hasattr(app.state, "redis_client"):
             await app.state.redis_client.close()
             logger.info("shutdown", step="redis_closed")
+        await dispose_engine()
+        logger.info("shutdown", step="database_pool_disposed")
     except Exception as e:
         logger.error("shutdown_error", error=str(e))
 
@@ -222,6 +240,9 @@ app = FastAPI(
     version="1.0.0",
     description="Production Logistics Delay Prevention API",
     lifespan=lifespan,
+    # orjson encodes the float-heavy prediction/metrics/route payloads several
+    # times faster than stdlib json (already a pinned dependency).
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url=None,
 )
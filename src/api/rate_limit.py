@@ -7,9 +7,8 @@ Falls back to in-memory counter when Redis is unavailable (degraded mode).
 
 from __future__ import annotations
 
-import asyncio
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Callable, Optional
 
 import structlog
@@ -19,22 +18,26 @@ logger = structlog.get_logger(__name__)
 
 
 class InMemoryRateLimiter:
-    """Thread-safe in-memory sliding window rate limiter (fallback)."""
+    """In-memory sliding window rate limiter (fallback).
+
+    check() does not await between reading and updating a window, so each
+    call is atomic on the event loop without a lock.
+    """
 
     def __init__(self) -> None:
-        self._windows: dict[str, list[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        self._windows: dict[str, deque[float]] = defaultdict(deque)
 
     async def check(self, key: str, max_requests: int, window_seconds: int = 60) -> bool:
         now = time.time()
         cutoff = now - window_seconds
-        async with self._lock:
-            window = self._windows[key]
-            window[:] = [t for t in window if t > cutoff]
-            if len(window) >= max_requests:
-                return False
-            window.append(now)
-            return True
+        window = self._windows[key]
+        # Timestamps are appended in order, so expired ones are at the left.
+        while window and window[0] <= cutoff:
+            window.popleft()
+        if len(window) >= max_requests:
+            return False
+        window.append(now)
+        return True
 
 
 _global_limiter = InMemoryRateLimiter()
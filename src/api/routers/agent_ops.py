@@ -23,6 +23,11 @@ AGENT_MAP: dict[str, str] = {
     "escalate": "Risk Agent",
 }
 
+# agent_decisions grows with every agent run; the dashboard aggregates a
+# bounded window of the most recent rows instead of the tenant's full history.
+AGENT_OPS_DEFAULT_LIMIT = 1000
+AGENT_OPS_MAX_LIMIT = 5000
+
 TOOL_MAP: dict[str, str] = {
     "redis": "Redis",
     "prediction_engine": "Prediction Engine",
@@ -74,6 +79,12 @@ def _parse_tools(tools_raw: Any) -> list[str]:
 
 @router.get("")
 async def get_agent_ops(
+    limit: int = Query(
+        AGENT_OPS_DEFAULT_LIMIT,
+        ge=1,
+        le=AGENT_OPS_MAX_LIMIT,
+        description="Most recent decisions to aggregate",
+    ),
     current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
     db=Depends(get_db),
 ) -> dict:
@@ -85,8 +96,9 @@ async def get_agent_ops(
                 FROM agent_decisions
                 WHERE tenant_id = :tenant_id
                 ORDER BY decided_at DESC
+                LIMIT :limit
             """),
-            {"tenant_id": current_tenant.tenant_id},
+            {"tenant_id": current_tenant.tenant_id, "limit": limit},
         )
         rows = rows_result.mappings().all()
     except Exception as e:
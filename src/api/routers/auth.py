@@ -15,13 +15,13 @@ from src.api.auth import (
     ALGORITHM,
     AuthenticatedTenant,
     _get_secret_key,
+    averify_password,
     create_access_token,
     create_refresh_token,
     get_current_tenant,
     hash_password,
     is_refresh_token_revoked,
     revoke_refresh_token,
-    verify_password,
 )
 from src.api.deps import get_db
 from src.api.rate_limit import check_rate_limit
@@ -102,7 +102,7 @@ async def login(
             detail="Password not set. Please use password reset.",
         )
 
-    if not verify_password(body.password, stored_hash):
+    if not await averify_password(body.password, stored_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
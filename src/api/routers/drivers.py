@@ -6,7 +6,8 @@ Driver information and fleet management.
 from typing import List
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy import text
 
 from src.api.auth import AuthenticatedTenant, get_current_tenant
@@ -17,6 +18,10 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(tags=["drivers"], prefix="/drivers")
 
+# Built once at import; the list query aliases its columns to DriverResponse's
+# field aliases so a whole page validates in one call.
+_DRIVER_LIST_ADAPTER = TypeAdapter(list[DriverResponse])
+
 
 def _risk_level(risk_score: float) -> RiskLevel:
     if risk_score < 0.3:
@@ -28,6 +33,7 @@ def _risk_level(risk_score: float) -> RiskLevel:
 
 @router.get("", response_model=List[DriverResponse])
 async def list_drivers(
+    limit: int = Query(500, ge=1, le=1000),
     current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
     db=Depends(get_db),
     redis_client=Depends(get_redis),
@@ -67,28 +73,13 @@ async def list_drivers(
             WHERE d.tenant_id = :tenant_id
             GROUP BY d.id, d.tenant_id, d.name, gps.latitude, gps.longitude
             ORDER BY active_order_count DESC, d.name ASC
+            LIMIT :limit
             """
         ),
-        {"tenant_id": current_tenant.tenant_id},
+        {"tenant_id": current_tenant.tenant_id, "limit": limit},
     )
 
-    drivers = []
-    for row in result.mappings().all():
-        drivers.append(
-            DriverResponse(
-                driverId=row["driver_id"],
-                tenantId=row["tenant_id"],
-                name=row["name"],
-                phone=row["phone"],
-                email=row["email"],
-                isActive=bool(row["is_active"]),
-                currentLatitude=row["current_latitude"],
-                currentLongitude=row["current_longitude"],
-                activeOrderCount=int(row["active_order_count"] or 0),
-            )
-        )
-
-    return drivers
+    return _DRIVER_LIST_ADAPTER.validate_python([dict(row) for row in result.mappings().all()])
 
 
 @router.get("/{driver_id}", response_model=DriverResponse)
@@ -210,33 +201,46 @@ async def get_driver_risk_summary(
     current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
     db=Depends(get_db),
 ) -> DriverRiskSummaryResponse:
+    # Bucket counts are window aggregates over every driver, so only the
+    # top 10 rows cross the wire instead of the whole fleet.
     result = await db.execute(
         text(
             """
+            WITH driver_risk AS (
+                SELECT
+                    d.id::text AS driver_id,
+                    COALESCE(d.name, 'Unknown') AS name,
+                    COALESCE(AVG(p.risk_score), 0.0) AS avg_risk_score
+                FROM drivers d
+                LEFT JOIN orders o ON o.driver_id = d.id AND o.tenant_id = d.tenant_id
+                LEFT JOIN LATERAL (
+                    SELECT pred.risk_score
+                    FROM predictions pred
+                    WHERE pred.order_id = o.id AND pred.tenant_id = :tenant_id
+                    ORDER BY pred.created_at DESC
+                    LIMIT 1
+                ) p ON TRUE
+                WHERE d.tenant_id = :tenant_id
+                GROUP BY d.id, d.name
+            )
             SELECT
-                d.id::text AS driver_id,
-                COALESCE(d.name, 'Unknown') AS name,
-                COALESCE(AVG(p.risk_score), 0.0) AS avg_risk_score
-            FROM drivers d
-            LEFT JOIN orders o ON o.driver_id = d.id AND o.tenant_id = d.tenant_id
-            LEFT JOIN LATERAL (
-                SELECT pred.risk_score
-                FROM predictions pred
-                WHERE pred.order_id = o.id AND pred.tenant_id = :tenant_id
-                ORDER BY pred.created_at DESC
-                LIMIT 1
-            ) p ON TRUE
-            WHERE d.tenant_id = :tenant_id
-            GROUP BY d.id, d.name
+                driver_id,
+                name,
+                avg_risk_score,
+                COUNT(*) OVER () AS total_drivers,
+                COUNT(*) FILTER (WHERE avg_risk_score >= 0.7) OVER () AS high_risk_drivers,
+                COUNT(*) FILTER (WHERE avg_risk_score >= 0.4 AND avg_risk_score < 0.7) OVER () AS medium_risk_drivers
+            FROM driver_risk
             ORDER BY avg_risk_score DESC
+            LIMIT 10
             """
         ),
         {"tenant_id": current_tenant.tenant_id},
     )
     rows = result.mappings().all()
-    total = len(rows)
-    high = len([row for row in rows if float(row["avg_risk_score"] or 0.0) >= 0.7])
-    medium = len([row for row in rows if 0.4 <= float(row["avg_risk_score"] or 0.0) < 0.7])
+    total = int(rows[0]["total_drivers"]) if rows else 0
+    high = int(rows[0]["high_risk_drivers"]) if rows else 0
+    medium = int(rows[0]["medium_risk_drivers"]) if rows else 0
     low = total - high - medium
     return DriverRiskSummaryResponse(
         totalDrivers=total,
@@ -250,6 +254,6 @@ async def get_driver_risk_summary(
                 "avg_risk_score": float(row["avg_risk_score"] or 0.0),
                 "risk_level": _risk_level(float(row["avg_risk_score"] or 0.0)).value,
             }
-            for row in rows[:10]
+            for row in rows
         ],
     )
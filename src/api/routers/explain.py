@@ -6,6 +6,7 @@ for a single order into one structured response.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from typing import Any
@@ -62,6 +63,8 @@ async def explain_order(
     """
     # ── 1. Load order state from Redis, fallback to DB ──────────────────
     order_state: dict[str, str] = {}
+    # Set when the DB fallback below already joined the driver row.
+    driver_name: str | None = None
     try:
         raw_state = await redis_client.hgetall(f"order:{order_id}")
         if raw_state:
@@ -77,8 +80,9 @@ async def explain_order(
             row = await db.execute(
                 text("""
                     SELECT o.status, o.driver_id, o.planned_stops, o.completed_stops,
-                           o.planned_eta
+                           o.planned_eta, d.name AS driver_name
                     FROM orders o
+                    LEFT JOIN drivers d ON d.id = o.driver_id AND d.tenant_id = o.tenant_id
                     WHERE o.tenant_id = :t AND o.id::text = :oid
                     LIMIT 1
                 """),
@@ -88,7 +92,12 @@ async def explain_order(
         except Exception:
             r = None
         if r:
-            order_state = {k: str(v) if v is not None else "" for k, v in r.items()}
+            driver_name = r["driver_name"]
+            order_state = {
+                k: str(v) if v is not None else ""
+                for k, v in r.items()
+                if k != "driver_name"
+            }
             order_state.setdefault("driver_on_time_rate", "0.85")
         else:
             # Order not in DB either — use sensible defaults
@@ -106,6 +115,7 @@ async def explain_order(
 
     # ── 2. Run prediction with SHAP ─────────────────────────────────────
     try:
+        now = datetime.now(timezone.utc)
         features = prediction_service.feature_builder.build_from_live(
             {
                 "order_id": order_id,
@@ -117,14 +127,15 @@ async def explain_order(
                 "eta_minutes_remaining": float(order_state.get("eta_minutes_remaining", 0.0)),
                 "speed": float(order_state.get("speed", 35.0)),
                 "deviation_meters": float(order_state.get("deviation_meters", 0.0)),
-                "hour_of_day": datetime.now(timezone.utc).hour,
-                "day_of_week": datetime.now(timezone.utc).weekday(),
+                "hour_of_day": now.hour,
+                "day_of_week": now.weekday(),
             },
             {
                 "driver_on_time_rate": float(order_state.get("driver_on_time_rate", 0.85)),
             },
         )
-        result = prediction_service.predict_with_shap(order_id, features)
+        # SHAP is CPU-bound; run it in a worker thread so the event loop stays free.
+        result = await asyncio.to_thread(prediction_service.predict_with_shap, order_id, features)
     except Exception as e:
         logger.error("explain_prediction_error", order_id=order_id, error=str(e))
         raise HTTPException(
@@ -280,20 +291,24 @@ async def explain_order(
 
     # ── 8. Order info from order_state ─────────────────────────────────
     driver_id = order_state.get("driver_id", "unknown")
-    driver_result = None
-    try:
-        driver_result = await db.execute(
-            text("SELECT name, id FROM drivers WHERE id::text = :did LIMIT 1"),
-            {"did": driver_id},
-        )
-        driver_row = driver_result.mappings().first()
-    except Exception:
-        driver_row = None
+    if driver_name is None and driver_id not in ("", "unknown"):
+        try:
+            driver_result = await db.execute(
+                text("""
+                    SELECT name FROM drivers
+                    WHERE tenant_id = :t AND id::text = :did
+                    LIMIT 1
+                """),
+                {"t": current_tenant.tenant_id, "did": driver_id},
+            )
+            driver_name = driver_result.scalar_one_or_none()
+        except Exception:
+            driver_name = None
 
     order_summary = {
         "order_id": order_id,
         "driver_id": driver_id,
-        "driver_name": driver_row["name"] if driver_row else "Unknown",
+        "driver_name": driver_name or "Unknown",
         "status": order_state.get("status", "unknown"),
         "risk_score": result.risk_score,
         "is_high_risk": result.is_high_risk,
@@ -69,7 +69,7 @@ async def health_check() -> HealthResponse:
     try:
         import os
 
-        if os.path.exists("models/model.joblib"):
+        if os.path.exists("models/model.ubj") or os.path.exists("models/model.joblib"):
             logger.info("health_check", service="model", status="ok")
         else:
             logger.warning("health_check", service="model", status="missing")
@@ -11,7 +11,7 @@ from typing import Optional
 
 import redis.asyncio as redis
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -45,11 +45,38 @@ def _get_risk_level(risk_score: float) -> RiskLevel:
         return RiskLevel.HIGH
 
 
-async def _set_tenant_context(db: AsyncSession, tenant_id: str, request_id: str | None = None) -> None:
-    # SQLite does not support set_config().
+_UPSERT_DRIVER_SQL = """
+    INSERT INTO drivers (id, tenant_id, name, historical_on_time_rate, total_deliveries)
+    VALUES (:driver_id, :tenant_id, :name, 0.85, 0)
+    ON CONFLICT (tenant_id, id) DO NOTHING
+"""
+
+_UPSERT_ORDER_SQL = """
+    INSERT INTO orders (
+        id, tenant_id, driver_id, status, planned_stops, completed_stops,
+        planned_eta, actual_eta, current_risk_score
+    ) VALUES (
+        :order_id, :tenant_id, :driver_id, 'pending', :planned_stops, 0,
+        :planned_eta, NULL, 0.0
+    )
+    ON CONFLICT (tenant_id, id) DO UPDATE
+    SET driver_id = EXCLUDED.driver_id,
+        status = EXCLUDED.status,
+        planned_stops = EXCLUDED.planned_stops,
+        planned_eta = EXCLUDED.planned_eta,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def _is_sqlite(db: AsyncSession) -> bool:
     # The connection binding tells us which dialect we are on.
     bind = db.get_bind()
-    if bind and hasattr(bind, "dialect") and bind.dialect.name == "sqlite":
+    return bool(bind and hasattr(bind, "dialect") and bind.dialect.name == "sqlite")
+
+
+async def _set_tenant_context(db: AsyncSession, tenant_id: str, request_id: str | None = None) -> None:
+    # SQLite does not support set_config().
+    if _is_sqlite(db):
         return
     await db.execute(
         text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"),
@@ -68,12 +95,14 @@ def _seed_api_key_hash(tenant_id: str) -> str:
 
 @router.get("", response_model=OrderListResponse)
 async def list_orders(
+    response: Response,
     current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
     status_filter: Optional[str] = Query(None, alias="status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=500),
+    after_id: Optional[str] = Query(None),
 ) -> OrderListResponse:
     """
     List active orders for tenant with pagination.
@@ -82,12 +111,16 @@ async def list_orders(
     - status: Filter by order status (optional)
     - page: Page number (default 1)
     - page_size: Items per page (default 20, max 100)
+    - after_id: Keyset cursor (optional). When set, returns the page_size
+      orders whose id sorts after it, ignoring page. The cursor for the
+      next page is returned in the X-Next-Cursor response header.
     """
     logger.info(
         "list_orders",
         tenant_id=current_tenant.tenant_id,
         page=page,
         page_size=page_size,
+        after_id=after_id,
     )
 
     await _set_tenant_context(db, current_tenant.tenant_id)
@@ -106,11 +139,23 @@ async def list_orders(
 
     offset = (page - 1) * page_size
     params_with_paging = dict(params)
-    params_with_paging.update({"limit": page_size, "offset": offset})
 
-    result = await db.execute(
-        text(
-            f"""
+    if after_id is not None:
+        # Keyset pagination: seek on (tenant_id, id) instead of scanning and
+        # discarding OFFSET rows. One extra row tells us whether a next page exists.
+        params_with_paging.update({"after_id": after_id, "limit": page_size + 1})
+        page_query = f"""
+            SELECT id, driver_id, status, planned_eta, actual_eta,
+                   current_risk_score, planned_stops, completed_stops,
+                   created_at, updated_at
+            FROM orders
+            WHERE {where_clause} AND id > :after_id
+            ORDER BY id
+            LIMIT :limit
+        """
+    else:
+        params_with_paging.update({"limit": page_size, "offset": offset})
+        page_query = f"""
             SELECT id, driver_id, status, planned_eta, actual_eta,
                    current_risk_score, planned_stops, completed_stops,
                    created_at, updated_at
@@ -118,17 +163,31 @@ async def list_orders(
             WHERE {where_clause}
             ORDER BY created_at DESC
             LIMIT :limit OFFSET :offset
-            """
-        ),
-        params_with_paging,
-    )
+        """
+
+    result = await db.execute(text(page_query), params_with_paging)
+    rows = result.mappings().all()
+
+    if after_id is not None:
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        if has_next:
+            response.headers["X-Next-Cursor"] = str(rows[-1]["id"])
+    else:
+        has_next = offset + page_size < total_count
+
+    # Fetch live position for the whole page in one pipelined round-trip
+    # rather than one HGETALL per row.
+    pipe = redis_client.pipeline(transaction=False)
+    for row in rows:
+        pipe.hmget(f"order:{row['id']}", "latitude", "longitude", "speed")
+    live_positions = await pipe.execute()
 
     items = []
-    for row in result.mappings().all():
-        redis_state = await redis_client.hgetall(f"order:{row['id']}")
-        latitude = float(redis_state.get("latitude", 0.0))
-        longitude = float(redis_state.get("longitude", 0.0))
-        speed = float(redis_state.get("speed", 0.0))
+    for row, (latitude, longitude, speed) in zip(rows, live_positions):
+        latitude = float(latitude or 0.0)
+        longitude = float(longitude or 0.0)
+        speed = float(speed or 0.0)
         planned_stops = int(row["planned_stops"] or 1)
         completed_stops = int(row["completed_stops"] or 0)
 
@@ -156,7 +215,7 @@ async def list_orders(
         total_count=total_count,
         page=page,
         page_size=page_size,
-        has_next=offset + page_size < total_count,
+        has_next=has_next,
     )
 
 
@@ -291,47 +350,25 @@ async def create_order(
     stops = [origin_stop, destination_stop]
     planned_stops = len(stops)
 
-    await db.execute(
-        text(
-            """
-            INSERT INTO drivers (id, tenant_id, name, historical_on_time_rate, total_deliveries)
-            VALUES (:driver_id, :tenant_id, :name, 0.85, 0)
-            ON CONFLICT (tenant_id, id) DO NOTHING
-            """
-        ),
-        {
-            "driver_id": request.driver_id,
-            "tenant_id": current_tenant.tenant_id,
-            "name": f"Driver {request.driver_id[:8]}",
-        },
-    )
-
-    await db.execute(
-        text(
-            """
-            INSERT INTO orders (
-                id, tenant_id, driver_id, status, planned_stops, completed_stops,
-                planned_eta, actual_eta, current_risk_score
-            ) VALUES (
-                :order_id, :tenant_id, :driver_id, 'pending', :planned_stops, 0,
-                :planned_eta, NULL, 0.0
-            )
-            ON CONFLICT (tenant_id, id) DO UPDATE
-            SET driver_id = EXCLUDED.driver_id,
-                status = EXCLUDED.status,
-                planned_stops = EXCLUDED.planned_stops,
-                planned_eta = EXCLUDED.planned_eta,
-                updated_at = CURRENT_TIMESTAMP
-            """
-        ),
-        {
-            "order_id": order_id,
-            "tenant_id": current_tenant.tenant_id,
-            "driver_id": request.driver_id,
-            "planned_stops": planned_stops,
-            "planned_eta": request.planned_eta,
-        },
-    )
+    upsert_params = {
+        "order_id": order_id,
+        "tenant_id": current_tenant.tenant_id,
+        "driver_id": request.driver_id,
+        "name": f"Driver {request.driver_id[:8]}",
+        "planned_stops": planned_stops,
+        "planned_eta": request.planned_eta,
+    }
+    if _is_sqlite(db):
+        # SQLite has no data-modifying CTEs; fall back to two statements.
+        await db.execute(text(_UPSERT_DRIVER_SQL), upsert_params)
+        await db.execute(text(_UPSERT_ORDER_SQL), upsert_params)
+    else:
+        # Single round-trip: the driver upsert runs as a data-modifying CTE
+        # alongside the order upsert, so both land atomically.
+        await db.execute(
+            text(f"WITH driver_upsert AS ({_UPSERT_DRIVER_SQL}) {_UPSERT_ORDER_SQL}"),
+            upsert_params,
+        )
     await db.commit()
 
     await redis_client.hset(
@@ -414,9 +451,12 @@ async def update_position(
     # Get request_id from context (added by middleware)
     request_id = getattr(current_tenant, "request_id", "unknown")
 
-    # Fast path: update Redis order state
-    await redis_client.hset(
-        f"order:{order_id}",
+    # Fast path: update Redis order state and read back what the fan-out
+    # needs in the same pipelined round-trip.
+    order_key = f"order:{order_id}"
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hset(
+        order_key,
         mapping={
             "latitude": request.latitude,
             "longitude": request.longitude,
@@ -425,17 +465,16 @@ async def update_position(
             "last_update": datetime.now(timezone.utc).isoformat(),
         },
     )
-
-    # Get current risk score (or default)
-    risk_score_str = await redis_client.hget(f"order:{order_id}", "risk_score")
+    # Current risk score (or default), and driver_id for the agent graph
+    # (requires it to be non-empty; stored in the hash at order creation).
+    pipe.hmget(order_key, "risk_score", "driver_id")
+    _, (risk_score_str, driver_id) = await pipe.execute()
     risk_score = float(risk_score_str) if risk_score_str else 0.5
+    driver_id = driver_id or ""
 
-    # Resolve driver_id for the agent graph (requires it to be non-empty)
-    # It was stored in the Redis hash at order creation time.
-    driver_id = await redis_client.hget(f"order:{order_id}", "driver_id") or ""
-
+    pipe = redis_client.pipeline(transaction=False)
     # Publish to Redis Streams (agent will consume)
-    await redis_client.xadd(
+    pipe.xadd(
         "gps_pings",
         {
             "order_id": order_id,
@@ -447,9 +486,8 @@ async def update_position(
             "event_type": request.event_type,
         },
     )
-
     # Publish to pub/sub so WebSocket forwards position to frontend
-    await redis_client.publish(
+    pipe.publish(
         f"tenant:{current_tenant.tenant_id}:events",
         json.dumps(
             {
@@ -464,6 +502,7 @@ async def update_position(
             }
         ),
     )
+    await pipe.execute()
 
     logger.info(
         "position_update_received",
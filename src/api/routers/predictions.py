@@ -3,11 +3,14 @@ Predictions router.
 Risk scores and delay predictions with SHAP explanations.
 """
 
+import asyncio
+import json
 from datetime import datetime, timezone
 
 import redis.asyncio as redis
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter, ValidationError
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,7 +18,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.auth import AuthenticatedTenant, get_current_tenant
 from src.api.deps import get_db, get_prediction_service, get_redis
 from src.api.schemas import PredictionResponse, RiskFactor
-from src.core.config import get_settings
 from src.core.metrics import (
     application_errors_total,
     model_cache_hits_total,
@@ -24,13 +26,26 @@ from src.core.metrics import (
     prediction_latency_seconds,
     prediction_risk_score,
 )
-from src.db.redis_schema import get_prediction_updates_channel, get_pubsub_events_channel
+from src.db.redis_schema import (
+    EXPLANATION_TTL_SECONDS,
+    get_explanation_key,
+    get_prediction_updates_channel,
+    get_pubsub_events_channel,
+)
 from src.ml.inference import PredictionService
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(tags=["predictions"], prefix="/predictions")
 
+# Global SHAP importance only depends on the loaded model artefact, so it is
+# computed once per model version instead of on every request.
+_feature_importance_cache: dict[str, dict] = {}
+
+# Built once at import so each request reuses the compiled validators.
+_ORDER_IDS_ADAPTER = TypeAdapter(list[str])
+_RISK_FACTORS_ADAPTER = TypeAdapter(list[RiskFactor])
+
 
 def _confidence_to_score(confidence: str) -> float:
     """Map model confidence labels to the API's numeric confidence field."""
@@ -42,11 +57,98 @@ def _confidence_to_score(confidence: str) -> float:
     return mapping.get(confidence.lower(), 0.8)
 
 
+def _to_risk_factors(factors: list[dict]) -> list[RiskFactor]:
+    """Convert the service's SHAP output into the API response schema."""
+    return [
+        RiskFactor(
+            feature=factor["feature"],
+            contribution=factor["contribution"],
+            direction=factor["direction"],
+            humanReadable=(
+                f"{factor['feature']} {factor['direction'].replace('_', ' ')}"
+            ),
+        )
+        for factor in factors
+    ]
+
+
+def _build_live_features(
+    prediction_service: PredictionService,
+    order_id: str,
+    order_state: dict,
+    now: datetime | None = None,
+) -> dict[str, float]:
+    """Build the live feature vector expected by the model from an order:{id} hash.
+
+    Batch callers pass one `now` so every order in the batch shares the same
+    temporal features instead of reading the clock per order.
+    """
+    now = now or datetime.now(timezone.utc)
+    return prediction_service.feature_builder.build_from_live(
+        {
+            "order_id": order_id,
+            "planned_stops": int(order_state.get("planned_stops", 1)),
+            "completed_stops": int(order_state.get("completed_stops", 0)),
+            "planned_duration_minutes": float(
+                order_state.get("planned_duration_minutes", 60.0)
+            ),
+            "actual_duration_so_far_minutes": float(
+                order_state.get("actual_duration_so_far_minutes", 0.0)
+            ),
+            "stops_remaining": int(order_state.get("stops_remaining", 0)),
+            "eta_minutes_remaining": float(
+                order_state.get("eta_minutes_remaining", 0.0)
+            ),
+            "speed": float(order_state.get("speed", 35.0)),
+            "deviation_meters": float(order_state.get("deviation_meters", 0.0)),
+            "hour_of_day": now.hour,
+            "day_of_week": now.weekday(),
+        },
+        {
+            "driver_on_time_rate": float(order_state.get("driver_on_time_rate", 0.85)),
+        },
+    )
+
+
+async def _store_explanation(
+    prediction_service: PredictionService,
+    redis_client: redis.Redis,
+    tenant_id: str,
+    order_id: str,
+    features: dict[str, float],
+) -> None:
+    """
+    Compute SHAP factors after the response has been sent.
+
+    SHAP is far slower than the model itself, so it runs in a worker thread
+    and the result is parked in Redis for GET /{order_id}/explanation. A
+    failure is stored too, so the endpoint stops reporting "pending".
+    """
+    try:
+        result = await asyncio.to_thread(
+            prediction_service.predict_with_shap, order_id, features
+        )
+        factors = _to_risk_factors(result.top_risk_factors)
+        explanation = {
+            "status": "ready",
+            "topRiskFactors": [f.model_dump(by_alias=True) for f in factors],
+        }
+    except Exception as e:
+        logger.warning("explanation_failed", order_id=order_id, error=str(e))
+        explanation = {"status": "failed", "topRiskFactors": []}
+    await redis_client.set(
+        get_explanation_key(tenant_id, order_id),
+        json.dumps(explanation),
+        ex=EXPLANATION_TTL_SECONDS,
+    )
+
+
 @router.post("/batch", response_model=dict)
 async def batch_predict(
     body: dict,
     current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
     redis_client: redis.Redis = Depends(get_redis),
+    prediction_service: PredictionService = Depends(get_prediction_service),
 ) -> dict[str, dict]:
     """
     Batch predictions for multiple order IDs.
@@ -58,12 +160,27 @@ async def batch_predict(
     frontend consumers (AICommandCenter.tsx used `batchResults[order.id]` which
     always returned undefined from a list; ModelInsights.tsx had an Array.isArray
     workaround proving the bug was known but patched locally instead of fixed).
+
+    Orders without a cached prediction but with live state in Redis are
+    scored together through PredictionService.predict_batch.
     """
-    order_ids = body.get("order_ids", [])
+    try:
+        order_ids = _ORDER_IDS_ADAPTER.validate_python(body.get("order_ids", []))
+    except ValidationError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="order_ids must be a list of strings",
+        )
     logger.info("batch_predict", count=len(order_ids), tenant_id=current_tenant.tenant_id)
     results: dict[str, dict] = {}
+
+    pipe = redis_client.pipeline(transaction=False)
     for oid in order_ids:
-        cached = await redis_client.hgetall(f"prediction:{oid}")
+        pipe.hgetall(f"prediction:{oid}")
+    cached_rows = await pipe.execute()
+
+    missing: list[str] = []
+    for oid, cached in zip(order_ids, cached_rows):
         if cached:
             risk_score = float(cached.get("risk_score", 0.5))
             results[oid] = {
@@ -74,14 +191,59 @@ async def batch_predict(
                 "confidence": float(cached.get("confidence", 0.8)),
             }
         else:
-            results[oid] = {
-                "order_id": oid,
-                "risk_score": 0.5,
-                "is_high_risk": False,
-                "predicted_delay_minutes": 0.0,
-                "confidence": 0.5,
-            }
-    return results
+            missing.append(oid)
+
+    # Score every cache miss that has live state in one model call. Rows are
+    # built and validated one by one first, so a malformed order only drops
+    # itself back to the default instead of failing the whole batch.
+    live_ids: list[str] = []
+    live_features: list[dict[str, float]] = []
+    if missing:
+        pipe = redis_client.pipeline(transaction=False)
+        for oid in missing:
+            pipe.hgetall(f"order:{oid}")
+        now = datetime.now(timezone.utc)
+        for oid, order_state in zip(missing, await pipe.execute()):
+            if not order_state:
+                continue
+            try:
+                features = _build_live_features(prediction_service, oid, order_state, now)
+                prediction_service.feature_builder.validate_features(features)
+            except (TypeError, ValueError) as e:
+                logger.warning("batch_predict_order_skipped", order_id=oid, error=str(e))
+                continue
+            live_ids.append(oid)
+            live_features.append(features)
+
+    if live_ids:
+        try:
+            start_time = datetime.now(timezone.utc)
+            batch_results = await asyncio.to_thread(
+                prediction_service.predict_batch, live_ids, live_features
+            )
+            for result in batch_results:
+                results[result.order_id] = {
+                    "order_id": result.order_id,
+                    "risk_score": result.risk_score,
+                    "is_high_risk": result.risk_score > 0.7,
+                    "predicted_delay_minutes": result.predicted_delay_minutes,
+                    "confidence": _confidence_to_score(result.confidence),
+                }
+            model_predictions_total.inc(len(live_ids))
+            prediction_latency_seconds.observe(
+                (datetime.now(timezone.utc) - start_time).total_seconds()
+            )
+        except Exception as e:
+            application_errors_total.labels(error_type="prediction", component="predictions_router").inc()
+            logger.error("batch_predict_failed", count=len(live_ids), error=str(e))
+
+    default = {
+        "risk_score": 0.5,
+        "is_high_risk": False,
+        "predicted_delay_minutes": 0.0,
+        "confidence": 0.5,
+    }
+    return {oid: results.get(oid, {"order_id": oid, **default}) for oid in order_ids}
 
 
 @router.get("/model/feature-importance", response_model=dict)
@@ -99,8 +261,14 @@ async def get_feature_importance(
     Previously this endpoint didn't exist: the catch-all route
     GET /model/{model_id:path} matched 'feature-importance' and 'info'
     identically, returning identical hardcoded data for both.
+
+    The result is memoized per model version; a reload under a new version
+    recomputes it.
     """
     logger.info("get_feature_importance", tenant_id=current_tenant.tenant_id)
+    cached = _feature_importance_cache.get(prediction_service.model_version)
+    if cached is not None:
+        return cached
     try:
         import numpy as np
 
@@ -115,7 +283,8 @@ async def get_feature_importance(
         ])
 
         explainer = prediction_service._get_explainer()
-        shap_values = explainer.shap_values(sample)  # shape: (sample_size, n_features)
+        # SHAP over the sample is CPU-bound; keep it off the event loop.
+        shap_values = await asyncio.to_thread(explainer.shap_values, sample)  # shape: (sample_size, n_features)
 
         # Mean absolute SHAP = global feature importance
         mean_abs_shap = np.abs(shap_values).mean(axis=0)
@@ -130,13 +299,15 @@ async def get_feature_importance(
             for i in range(len(feature_names))
         ], key=lambda x: x["importance"], reverse=True)
 
-        return {
+        payload = {
             "model_version": prediction_service.model_version,
             "method": "shap_mean_absolute",
             "sample_size": sample_size,
             "features": importance_list,
             "top_feature": importance_list[0]["feature"] if importance_list else None,
         }
+        _feature_importance_cache[prediction_service.model_version] = payload
+        return payload
 
     except Exception as e:
         logger.error("feature_importance_error", error=str(e))
@@ -204,18 +375,45 @@ async def get_prediction_history(
     }]
 
 
+@router.get("/{order_id}/explanation", response_model=dict)
+async def get_prediction_explanation(
+    order_id: str,
+    current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
+    redis_client: redis.Redis = Depends(get_redis),
+) -> dict:
+    """
+    Return SHAP risk factors computed in the background by
+    GET /{order_id}?explain=false. Reports "pending" until they land and
+    "failed" if SHAP could not be computed.
+
+    Explanations are keyed by tenant, so a caller only ever sees factors
+    stored for its own orders.
+    """
+    logger.info("get_prediction_explanation", order_id=order_id, tenant_id=current_tenant.tenant_id)
+    cached = await redis_client.get(get_explanation_key(current_tenant.tenant_id, order_id))
+    if cached is None:
+        return {"order_id": order_id, "status": "pending", "topRiskFactors": []}
+    return {"order_id": order_id, **json.loads(cached)}
+
+
 @router.get("/{order_id}", response_model=PredictionResponse)
 async def get_prediction(
     order_id: str,
+    background_tasks: BackgroundTasks,
+    explain: bool = Query(True, description="Compute SHAP factors inline; false defers them"),
     current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
     redis_client: redis.Redis = Depends(get_redis),
     prediction_service: PredictionService = Depends(get_prediction_service),
+    db: AsyncSession = Depends(get_db),
 ) -> PredictionResponse:
     """
     Get current delay prediction for order.
 
     Returns risk score with top risk factors and SHAP explanations.
     Includes confidence and predicted delay in minutes.
+
+    With explain=false the response carries no risk factors; SHAP runs as a
+    background task and is served by GET /{order_id}/explanation.
     """
     logger.info(
         "get_prediction",
@@ -241,8 +439,6 @@ async def get_prediction(
             top_factors_json = cached_prediction.get(
                 "top_risk_factors", "[]"
             )
-            import json
-
             top_factors = json.loads(top_factors_json)
 
             return PredictionResponse(
@@ -250,9 +446,7 @@ async def get_prediction(
                 riskScore=risk_score,
                 isHighRisk=risk_score > 0.70,
                 confidence=confidence,
-                topRiskFactors=[
-                    RiskFactor(**factor) for factor in top_factors
-                ],
+                topRiskFactors=_RISK_FACTORS_ADAPTER.validate_python(top_factors),
                 predictedDelayMinutes=predicted_delay,
                 currentEta=datetime.now(timezone.utc),
                 modelVersion="1.0.0",
@@ -269,75 +463,53 @@ async def get_prediction(
         # Get order state from Redis (fall back to PostgreSQL if not found)
         order_state = await redis_client.hgetall(f"order:{order_id}")
         if not order_state:
-            settings = get_settings()
-            from sqlalchemy.ext.asyncio import create_async_engine
-            engine = create_async_engine(settings.database_url)
-            async with AsyncSession(engine) as db:
-                r = await db.execute(
-                    text("SELECT planned_stops, completed_stops FROM orders WHERE id = :oid"),
-                    {"oid": order_id}
+            # Uses the pooled request session rather than a throwaway engine,
+            # so a cache miss does not pay a fresh connection handshake.
+            r = await db.execute(
+                text("""
+                    SELECT planned_stops, completed_stops FROM orders
+                    WHERE id = :oid AND tenant_id = :tenant_id
+                """),
+                {"oid": order_id, "tenant_id": current_tenant.tenant_id},
+            )
+            row = r.fetchone()
+            if row:
+                order_state = {
+                    "planned_stops": str(row.planned_stops),
+                    "completed_stops": str(row.completed_stops),
+                    "stops_remaining": str(max(0, row.planned_stops - row.completed_stops)),
+                    "eta_minutes_remaining": "60.0",
+                    "speed": "0.0",
+                    "deviation_meters": "0.0",
+                    "driver_on_time_rate": "0.85",
+                }
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Order {order_id} not found",
                 )
-                row = r.fetchone()
-                if row:
-                    order_state = {
-                        "planned_stops": str(row.planned_stops),
-                        "completed_stops": str(row.completed_stops),
-                        "stops_remaining": str(max(0, row.planned_stops - row.completed_stops)),
-                        "eta_minutes_remaining": "60.0",
-                        "speed": "0.0",
-                        "deviation_meters": "0.0",
-                        "driver_on_time_rate": "0.85",
-                    }
-                else:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Order {order_id} not found",
-                    )
-            await engine.dispose()
-
-        # Build the live feature vector expected by the model.
-        features = prediction_service.feature_builder.build_from_live(
-            {
-                "order_id": order_id,
-                "planned_stops": int(order_state.get("planned_stops", 1)),
-                "completed_stops": int(order_state.get("completed_stops", 0)),
-                "planned_duration_minutes": float(
-                    order_state.get("planned_duration_minutes", 60.0)
-                ),
-                "actual_duration_so_far_minutes": float(
-                    order_state.get("actual_duration_so_far_minutes", 0.0)
-                ),
-                "stops_remaining": int(order_state.get("stops_remaining", 0)),
-                "eta_minutes_remaining": float(
-                    order_state.get("eta_minutes_remaining", 0.0)
-                ),
-                "speed": float(order_state.get("speed", 35.0)),
-                "deviation_meters": float(order_state.get("deviation_meters", 0.0)),
-                "hour_of_day": datetime.now(timezone.utc).hour,
-                "day_of_week": datetime.now(timezone.utc).weekday(),
-            },
-            {
-                "driver_on_time_rate": float(order_state.get("driver_on_time_rate", 0.85)),
-            },
-        )
 
-        # Run prediction with SHAP so the API can return structured factors.
-        result = prediction_service.predict_with_shap(order_id, features)
-
-        # Convert the service's SHAP output into the API response schema.
-        top_factors = [
-            RiskFactor(
-                feature=factor["feature"],
-                contribution=factor["contribution"],
-                direction=factor["direction"],
-                humanReadable=(
-                    f"{factor['feature']} {factor['direction'].replace('_', ' ')}"
-                ),
+        features = _build_live_features(prediction_service, order_id, order_state)
+
+        if explain:
+            # Run prediction with SHAP so the API can return structured factors.
+            # Model and SHAP are CPU-bound, so they run in a worker thread.
+            result = await asyncio.to_thread(
+                prediction_service.predict_with_shap, order_id, features
+            )
+        else:
+            # Inference only; SHAP is deferred until after the response.
+            result = await asyncio.to_thread(prediction_service.predict, order_id, features)
+            background_tasks.add_task(
+                _store_explanation,
+                prediction_service,
+                redis_client,
+                current_tenant.tenant_id,
+                order_id,
+                features,
             )
-            for factor in result.top_risk_factors
-        ]
 
-        import json
+        top_factors = _to_risk_factors(result.top_risk_factors)
 
         prediction_payload = {
             "type": "prediction_updated",
@@ -348,16 +520,19 @@ async def get_prediction(
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        await redis_client.hset(
-            f"prediction:{order_id}",
-            mapping={
-                "risk_score": str(result.risk_score),
-                "predicted_delay_minutes": str(result.predicted_delay_minutes),
-                "confidence": str(_confidence_to_score(result.confidence)),
-                "top_risk_factors": json.dumps([f.model_dump(by_alias=True) for f in top_factors]),
-            },
-        )
-        await redis_client.expire(f"prediction:{order_id}", 30)
+        # The cache hit path serves explain=true callers, so a deferred
+        # response (no factors yet) must not populate it.
+        if explain:
+            await redis_client.hset(
+                f"prediction:{order_id}",
+                mapping={
+                    "risk_score": str(result.risk_score),
+                    "predicted_delay_minutes": str(result.predicted_delay_minutes),
+                    "confidence": str(_confidence_to_score(result.confidence)),
+                    "top_risk_factors": json.dumps([f.model_dump(by_alias=True) for f in top_factors]),
+                },
+            )
+            await redis_client.expire(f"prediction:{order_id}", 30)
 
         await redis_client.publish(
             get_prediction_updates_channel(),
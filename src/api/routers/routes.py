@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import text
 
 from src.api.auth import AuthenticatedTenant, get_current_tenant
@@ -64,8 +64,8 @@ async def _load_order_stops(redis_client: Any, order_id: str, tenant_id: str | N
 
     # Fallback to PostgreSQL when Redis is empty (e.g. fakeredis dev mode)
     try:
-        from src.api.deps import _get_session_maker
-        session_maker = _get_session_maker()
+        from src.api.deps import get_session_maker
+        session_maker = get_session_maker()
         async with session_maker() as db:
             result = await db.execute(
                 text("SELECT id, planned_stops, current_risk_score FROM orders WHERE id = :id"),
@@ -280,13 +280,18 @@ async def get_current_route(
 @router.get("/{order_id}/history")
 async def get_route_history(
     order_id: str,
+    include_waypoints: bool = Query(
+        True, description="Include each plan's waypoints JSON; false returns summary columns only"
+    ),
     current_tenant: AuthenticatedTenant = Depends(get_current_tenant),
     db=Depends(get_db),
 ) -> list[dict[str, Any]]:
+    # waypoints is the only large column; summary views skip reading it entirely.
+    waypoints_column = "waypoints, " if include_waypoints else ""
     result = await db.execute(
         text(
-            """
-            SELECT id::text AS route_plan_id, order_id::text AS order_id, created_at, waypoints,
+            f"""
+            SELECT id::text AS route_plan_id, order_id::text AS order_id, created_at, {waypoints_column}
                    total_distance_km, total_duration_minutes, solver_status, solver_duration_ms
             FROM route_plans
             WHERE tenant_id = :tenant_id AND order_id = :order_id
@@ -27,7 +27,7 @@ from fastapi.websockets import WebSocket
 from sqlalchemy import text
 
 from src.api.auth import AuthenticatedTenant, get_current_tenant_ws
-from src.api.deps import get_redis as get_redis_client, _get_session_maker
+from src.api.deps import get_redis as get_redis_client, get_session_maker
 from src.core.config import get_settings
 from src.core.metrics import (
     websocket_connections_active,
@@ -141,7 +141,7 @@ async def websocket_endpoint(websocket: WebSocket):
         # 2. Fallback to PostgreSQL — ALWAYS filter by tenant_id (never scan all orders)
         if not initial_orders:
             try:
-                session_maker = _get_session_maker()
+                session_maker = get_session_maker()
                 async with session_maker() as db:
                     result = await db.execute(
                         text("""
@@ -41,33 +41,46 @@ class AnalyticsService:
         return await self._get_metrics_pg(tenant_id)
 
     async def _get_metrics_sqlite(self, tenant_id: str) -> OperationalAnalytics:
-        orders_result = await self.db.execute(
+        # Same single round-trip shape as the PostgreSQL path: one-row CTEs
+        # cross-joined into one summary row.
+        summary_result = await self.db.execute(
             text("""
-                SELECT
-                    COUNT(*) AS orders_processed,
-                    COUNT(*) FILTER (WHERE status <> 'completed') AS active_deliveries,
-                    COUNT(*) FILTER (WHERE current_risk_score >= 0.70 AND status <> 'completed') AS high_risk_deliveries,
-                    COALESCE(AVG(
-                        CASE
-                            WHEN actual_eta IS NOT NULL AND actual_eta > planned_eta
-                            THEN (julianday(actual_eta) - julianday(planned_eta)) * 24 * 60
-                            ELSE 0
-                        END
-                    ), 0) AS average_delay_minutes,
-                    COUNT(*) FILTER (WHERE actual_eta IS NOT NULL AND actual_eta <= planned_eta) AS on_time_orders,
-                    COUNT(*) FILTER (WHERE actual_eta IS NOT NULL) AS completed_orders
-                FROM orders
-                WHERE tenant_id = :tenant_id
+                WITH order_stats AS (
+                    SELECT
+                        COUNT(*) AS orders_processed,
+                        COUNT(*) FILTER (WHERE status <> 'completed') AS active_deliveries,
+                        COUNT(*) FILTER (WHERE current_risk_score >= 0.70 AND status <> 'completed') AS high_risk_deliveries,
+                        COALESCE(AVG(
+                            CASE
+                                WHEN actual_eta IS NOT NULL AND actual_eta > planned_eta
+                                THEN (julianday(actual_eta) - julianday(planned_eta)) * 24 * 60
+                                ELSE 0
+                            END
+                        ), 0) AS average_delay_minutes,
+                        COUNT(*) FILTER (WHERE actual_eta IS NOT NULL AND actual_eta <= planned_eta) AS on_time_orders,
+                        COUNT(*) FILTER (WHERE actual_eta IS NOT NULL) AS completed_orders
+                    FROM orders
+                    WHERE tenant_id = :tenant_id
+                ),
+                agent_stats AS (
+                    SELECT COUNT(*) AS agent_interventions
+                    FROM agent_decisions
+                    WHERE tenant_id = :tenant_id
+                ),
+                prediction_stats AS (
+                    SELECT
+                        COUNT(*) FILTER (WHERE is_high_risk = 1 AND risk_score >= 0.70) AS true_positive,
+                        COUNT(*) FILTER (WHERE is_high_risk = 0 AND risk_score < 0.70) AS true_negative,
+                        COUNT(*) AS total_predictions
+                    FROM predictions
+                    WHERE tenant_id = :tenant_id
+                )
+                SELECT *
+                FROM order_stats, agent_stats, prediction_stats
             """),
             {"tenant_id": tenant_id},
         )
-        order_row = orders_result.mappings().one()
-
-        agent_result = await self.db.execute(
-            text("SELECT COUNT(*) AS agent_interventions FROM agent_decisions WHERE tenant_id = :tenant_id"),
-            {"tenant_id": tenant_id},
-        )
-        agent_row = agent_result.mappings().one()
+        summary_row = summary_result.mappings().one()
 
         driver_result = await self.db.execute(
             text("""
@@ -84,34 +97,21 @@ class AnalyticsService:
             {"tenant_id": tenant_id},
         )
 
-        pred_result = await self.db.execute(
-            text("""
-                SELECT
-                    COUNT(*) FILTER (WHERE is_high_risk = 1 AND risk_score >= 0.70) AS true_positive,
-                    COUNT(*) FILTER (WHERE is_high_risk = 0 AND risk_score < 0.70) AS true_negative,
-                    COUNT(*) AS total_predictions
-                FROM predictions
-                WHERE tenant_id = :tenant_id
-            """),
-            {"tenant_id": tenant_id},
-        )
-        pred_row = pred_result.mappings().one()
-
         # Driver distribution from subquery result
         driver_rows = driver_result.mappings().all()
-        on_time_orders = int(order_row["on_time_orders"] or 0)
-        completed_orders = int(order_row["completed_orders"] or 0)
+        on_time_orders = int(summary_row["on_time_orders"] or 0)
+        completed_orders = int(summary_row["completed_orders"] or 0)
         on_time_pct = (on_time_orders / completed_orders * 100.0) if completed_orders else 100.0
 
-        total_predictions = int(pred_row["total_predictions"] or 0)
-        correct = int(pred_row["true_positive"] or 0) + int(pred_row["true_negative"] or 0)
+        total_predictions = int(summary_row["total_predictions"] or 0)
+        correct = int(summary_row["true_positive"] or 0) + int(summary_row["true_negative"] or 0)
         pred_accuracy = (correct / total_predictions * 100.0) if total_predictions else 0.0
 
         fleet_health = max(0.0, min(100.0, round(
             on_time_pct * 0.45
-            + max(0.0, 100.0 - float(order_row["high_risk_deliveries"] or 0) * 4.0) * 0.25
-            + max(0.0, 100.0 - float(order_row["average_delay_minutes"] or 0) * 2.0) * 0.20
-            + max(0.0, 100.0 - float(agent_row["agent_interventions"] or 0) * 0.5) * 0.10,
+            + max(0.0, 100.0 - float(summary_row["high_risk_deliveries"] or 0) * 4.0) * 0.25
+            + max(0.0, 100.0 - float(summary_row["average_delay_minutes"] or 0) * 2.0) * 0.20
+            + max(0.0, 100.0 - float(summary_row["agent_interventions"] or 0) * 0.5) * 0.10,
             2,
         )))
 
@@ -127,11 +127,11 @@ class AnalyticsService:
             })
 
         return OperationalAnalytics(
-            orders_processed=int(order_row["orders_processed"] or 0),
-            active_deliveries=int(order_row["active_deliveries"] or 0),
-            high_risk_deliveries=int(order_row["high_risk_deliveries"] or 0),
-            average_delay_minutes=float(order_row["average_delay_minutes"] or 0),
-            agent_interventions=int(agent_row["agent_interventions"] or 0),
+            orders_processed=int(summary_row["orders_processed"] or 0),
+            active_deliveries=int(summary_row["active_deliveries"] or 0),
+            high_risk_deliveries=int(summary_row["high_risk_deliveries"] or 0),
+            average_delay_minutes=float(summary_row["average_delay_minutes"] or 0),
+            agent_interventions=int(summary_row["agent_interventions"] or 0),
             on_time_percentage=round(on_time_pct, 2),
             driver_risk_distribution=driver_risk_distribution,
             prediction_accuracy=round(pred_accuracy, 2),
@@ -140,48 +140,48 @@ class AnalyticsService:
         )
 
     async def _get_metrics_pg(self, tenant_id: str) -> OperationalAnalytics:
-        orders_result = await self.db.execute(
-            text(
-                """
-                SELECT
-                    COUNT(*) AS orders_processed,
-                    COUNT(*) FILTER (WHERE status <> 'completed') AS active_deliveries,
-                    COUNT(*) FILTER (WHERE current_risk_score >= 0.70 AND status <> 'completed') AS high_risk_deliveries,
-                    COALESCE(AVG(GREATEST(EXTRACT(EPOCH FROM (COALESCE(actual_eta, NOW()) - planned_eta)) / 60.0, 0)), 0) AS average_delay_minutes,
-                    COUNT(*) FILTER (WHERE actual_eta IS NOT NULL AND actual_eta <= planned_eta) AS on_time_orders,
-                    COUNT(*) FILTER (WHERE actual_eta IS NOT NULL) AS completed_orders
-                FROM orders
-                WHERE tenant_id = :tenant_id
-                """
-            ),
-            {"tenant_id": tenant_id},
-        )
-        order_row = orders_result.mappings().one()
-
-        agent_result = await self.db.execute(
-            text(
-                """
-                SELECT COUNT(*) AS agent_interventions
-                FROM agent_decisions
-                WHERE tenant_id = :tenant_id
-                """
-            ),
-            {"tenant_id": tenant_id},
-        )
-        agent_row = agent_result.mappings().one()
-
-        gps_result = await self.db.execute(
+        # Every scalar aggregate comes back in a single round-trip: each CTE
+        # yields exactly one row, so the cross join is one row as well.
+        summary_result = await self.db.execute(
             text(
                 """
-                SELECT COUNT(*) AS gps_event_count
-                FROM gps_events
-                WHERE tenant_id = :tenant_id
-                  AND recorded_at >= NOW() - INTERVAL '24 hours'
+                WITH order_stats AS (
+                    SELECT
+                        COUNT(*) AS orders_processed,
+                        COUNT(*) FILTER (WHERE status <> 'completed') AS active_deliveries,
+                        COUNT(*) FILTER (WHERE current_risk_score >= 0.70 AND status <> 'completed') AS high_risk_deliveries,
+                        COALESCE(AVG(GREATEST(EXTRACT(EPOCH FROM (COALESCE(actual_eta, NOW()) - planned_eta)) / 60.0, 0)), 0) AS average_delay_minutes,
+                        COUNT(*) FILTER (WHERE actual_eta IS NOT NULL AND actual_eta <= planned_eta) AS on_time_orders,
+                        COUNT(*) FILTER (WHERE actual_eta IS NOT NULL) AS completed_orders
+                    FROM orders
+                    WHERE tenant_id = :tenant_id
+                ),
+                agent_stats AS (
+                    SELECT COUNT(*) AS agent_interventions
+                    FROM agent_decisions
+                    WHERE tenant_id = :tenant_id
+                ),
+                gps_stats AS (
+                    SELECT COUNT(*) AS gps_event_count
+                    FROM gps_events
+                    WHERE tenant_id = :tenant_id
+                      AND recorded_at >= NOW() - INTERVAL '24 hours'
+                ),
+                prediction_stats AS (
+                    SELECT
+                        COUNT(*) FILTER (WHERE is_high_risk = TRUE AND risk_score >= 0.70) AS true_positive,
+                        COUNT(*) FILTER (WHERE is_high_risk = FALSE AND risk_score < 0.70) AS true_negative,
+                        COUNT(*) AS total_predictions
+                    FROM predictions
+                    WHERE tenant_id = :tenant_id
+                )
+                SELECT *
+                FROM order_stats, agent_stats, gps_stats, prediction_stats
                 """
             ),
             {"tenant_id": tenant_id},
         )
-        gps_row = gps_result.mappings().one()
+        summary_row = summary_result.mappings().one()
 
         driver_distribution_result = await self.db.execute(
             text(
@@ -213,27 +213,12 @@ class AnalyticsService:
         )
         driver_rows = driver_distribution_result.mappings().all()
 
-        prediction_accuracy_result = await self.db.execute(
-            text(
-                """
-                SELECT
-                    COUNT(*) FILTER (WHERE is_high_risk = TRUE AND risk_score >= 0.70) AS true_positive,
-                    COUNT(*) FILTER (WHERE is_high_risk = FALSE AND risk_score < 0.70) AS true_negative,
-                    COUNT(*) AS total_predictions
-                FROM predictions
-                WHERE tenant_id = :tenant_id
-                """
-            ),
-            {"tenant_id": tenant_id},
-        )
-        prediction_row = prediction_accuracy_result.mappings().one()
-
-        on_time_orders = int(order_row["on_time_orders"] or 0)
-        completed_orders = int(order_row["completed_orders"] or 0)
+        on_time_orders = int(summary_row["on_time_orders"] or 0)
+        completed_orders = int(summary_row["completed_orders"] or 0)
         on_time_percentage = (on_time_orders / completed_orders * 100.0) if completed_orders else 100.0
 
-        total_predictions = int(prediction_row["total_predictions"] or 0)
-        correct_predictions = int(prediction_row["true_positive"] or 0) + int(prediction_row["true_negative"] or 0)
+        total_predictions = int(summary_row["total_predictions"] or 0)
+        correct_predictions = int(summary_row["true_positive"] or 0) + int(summary_row["true_negative"] or 0)
         prediction_accuracy = (correct_predictions / total_predictions * 100.0) if total_predictions else 0.0
 
         fleet_health_score = max(
@@ -242,9 +227,9 @@ class AnalyticsService:
                 100.0,
                 round(
                     on_time_percentage * 0.45
-                    + max(0.0, 100.0 - float(order_row["high_risk_deliveries"] or 0) * 4.0) * 0.25
-                    + max(0.0, 100.0 - float(order_row["average_delay_minutes"] or 0) * 2.0) * 0.20
-                    + max(0.0, 100.0 - float(agent_row["agent_interventions"] or 0) * 0.5) * 0.10,
+                    + max(0.0, 100.0 - float(summary_row["high_risk_deliveries"] or 0) * 4.0) * 0.25
+                    + max(0.0, 100.0 - float(summary_row["average_delay_minutes"] or 0) * 2.0) * 0.20
+                    + max(0.0, 100.0 - float(summary_row["agent_interventions"] or 0) * 0.5) * 0.10,
                     2,
                 ),
             ),
@@ -264,16 +249,16 @@ class AnalyticsService:
             )
 
         return OperationalAnalytics(
-            orders_processed=int(order_row["orders_processed"] or 0),
-            active_deliveries=int(order_row["active_deliveries"] or 0),
-            high_risk_deliveries=int(order_row["high_risk_deliveries"] or 0),
-            average_delay_minutes=float(order_row["average_delay_minutes"] or 0),
-            agent_interventions=int(agent_row["agent_interventions"] or 0),
+            orders_processed=int(summary_row["orders_processed"] or 0),
+            active_deliveries=int(summary_row["active_deliveries"] or 0),
+            high_risk_deliveries=int(summary_row["high_risk_deliveries"] or 0),
+            average_delay_minutes=float(summary_row["average_delay_minutes"] or 0),
+            agent_interventions=int(summary_row["agent_interventions"] or 0),
             on_time_percentage=round(on_time_percentage, 2),
             driver_risk_distribution=driver_risk_distribution,
             prediction_accuracy=round(prediction_accuracy, 2),
             fleet_health_score=round(fleet_health_score, 2),
-            gps_event_count=int(gps_row["gps_event_count"] or 0),
+            gps_event_count=int(summary_row["gps_event_count"] or 0),
         )
 
     async def get_delay_causes(self, tenant_id: str) -> list[dict[str, Any]]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -155,14 +156,14 @@ class OperationsCopilotService:
             orders_data = await self._fetch_supporting_orders(tenant_id, insight.related_order_ids)
             result["supporting_orders"] = orders_data
 
-            for o in orders_data:
-                oid = o["order_id"]
-                pred = await self._fetch_prediction(tenant_id, oid)
-                if pred:
-                    result["supporting_predictions"].append(pred)
-                dec = await self._fetch_latest_decision(tenant_id, oid)
-                if dec:
-                    result["supporting_decisions"].append(dec)
+            # One query per child table for all orders, not two per order.
+            supporting_ids = [o["order_id"] for o in orders_data]
+            result["supporting_predictions"] = await self._fetch_predictions(
+                tenant_id, supporting_ids
+            )
+            result["supporting_decisions"] = await self._fetch_latest_decisions(
+                tenant_id, supporting_ids
+            )
 
             result["recommended_actions"] = self._build_actions_from_orders(
                 orders_data, insight
@@ -178,8 +179,7 @@ class OperationsCopilotService:
     ) -> list[dict[str, Any]]:
         if not order_ids:
             return []
-        placeholders = ",".join(f":oid{i}" for i in range(len(order_ids)))
-        params = {"tenant_id": tenant_id, **{f"oid{i}": oid for i, oid in enumerate(order_ids)}}
+        placeholders, params = self._order_id_params(tenant_id, order_ids)
         result = await self.db.execute(
             text(f"""
                 SELECT
@@ -213,29 +213,49 @@ class OperationsCopilotService:
             for r in rows
         ]
 
-    async def _fetch_prediction(
-        self, tenant_id: str, order_id: str
-    ) -> Optional[dict[str, Any]]:
+    @staticmethod
+    def _order_id_params(
+        tenant_id: str, order_ids: list[str]
+    ) -> tuple[str, dict[str, Any]]:
+        placeholders = ",".join(f":oid{i}" for i in range(len(order_ids)))
+        params = {"tenant_id": tenant_id, **{f"oid{i}": oid for i, oid in enumerate(order_ids)}}
+        return placeholders, params
+
+    async def _fetch_predictions(
+        self, tenant_id: str, order_ids: list[str]
+    ) -> list[dict[str, Any]]:
+        """Latest prediction per order, in order_ids order."""
+        if not order_ids:
+            return []
+        placeholders, params = self._order_id_params(tenant_id, order_ids)
         try:
             result = await self.db.execute(
-                text("""
-                    SELECT
+                text(f"""
+                    SELECT DISTINCT ON (p.order_id)
+                        p.order_id::text AS order_id,
                         p.risk_score,
                         p.confidence,
                         p.predicted_delay_minutes,
                         p.top_risk_factors,
                         p.model_version
                     FROM predictions p
-                    WHERE p.order_id::text = :oid AND p.tenant_id = :tenant_id
-                    ORDER BY p.created_at DESC
-                    LIMIT 1
+                    WHERE p.tenant_id = :tenant_id AND p.order_id::text IN ({placeholders})
+                    ORDER BY p.order_id, p.created_at DESC
                 """),
-                {"oid": order_id, "tenant_id": tenant_id},
+                params,
             )
-            row = (await result.mappings().all())[0]
+            rows = {r["order_id"]: r for r in result.mappings().all()}
+        except Exception as e:
+            self.logger.warning("workspace_predictions_query_failed", error=str(e))
+            return []
+
+        predictions: list[dict[str, Any]] = []
+        for order_id in order_ids:
+            row = rows.get(order_id)
+            if row is None:
+                continue
             factors = row.get("top_risk_factors", [])
             if isinstance(factors, str):
-                import json
                 try:
                     factors = json.loads(factors)
                 except Exception:
@@ -246,50 +266,58 @@ class OperationsCopilotService:
                     top_factors.append(f.get("feature", f.get("human_readable", str(f))))
                 elif isinstance(f, str):
                     top_factors.append(f)
-            return {
+            predictions.append({
                 "order_id": order_id,
-                "risk_score": float(row.get("risk_score", 0)),
-                "confidence": float(row.get("confidence", 0)),
-                "predicted_delay_minutes": float(row.get("predicted_delay_minutes", 0)),
+                "risk_score": float(row.get("risk_score") or 0),
+                "confidence": float(row.get("confidence") or 0),
+                "predicted_delay_minutes": float(row.get("predicted_delay_minutes") or 0),
                 "top_factors": top_factors,
-                "model_version": str(row.get("model_version", "unknown")),
-            }
-        except (IndexError, Exception):
-            return None
+                "model_version": str(row.get("model_version") or "unknown"),
+            })
+        return predictions
 
-    async def _fetch_latest_decision(
-        self, tenant_id: str, order_id: str
-    ) -> Optional[dict[str, Any]]:
+    async def _fetch_latest_decisions(
+        self, tenant_id: str, order_ids: list[str]
+    ) -> list[dict[str, Any]]:
+        """Latest agent decision per order, in order_ids order."""
+        if not order_ids:
+            return []
+        placeholders, params = self._order_id_params(tenant_id, order_ids)
         try:
             result = await self.db.execute(
-                text("""
-                    SELECT
+                text(f"""
+                    SELECT DISTINCT ON (order_id)
                         id::text AS decision_id,
-                        order_id::text,
-                        decision_type,
+                        order_id::text AS order_id,
+                        decision AS decision_type,
                         outcome,
                         reasoning,
                         risk_score,
-                        created_at::text AS timestamp
+                        decided_at::text AS timestamp
                     FROM agent_decisions
-                    WHERE order_id::text = :oid AND tenant_id = :tenant_id
-                    ORDER BY created_at DESC
-                    LIMIT 1
+                    WHERE tenant_id = :tenant_id AND order_id::text IN ({placeholders})
+                    ORDER BY order_id, decided_at DESC
                 """),
-                {"oid": order_id, "tenant_id": tenant_id},
+                params,
             )
-            row = (await result.mappings().all())[0]
-            return {
+            rows = {r["order_id"]: r for r in result.mappings().all()}
+        except Exception as e:
+            self.logger.warning("workspace_decisions_query_failed", error=str(e))
+            return []
+
+        return [
+            {
                 "decision_id": row["decision_id"],
                 "order_id": row["order_id"],
-                "decision_type": row.get("decision_type", "unknown"),
-                "outcome": row.get("outcome", "unknown"),
-                "reasoning": row.get("reasoning", ""),
-                "risk_score": float(row.get("risk_score", 0)),
-                "timestamp": row.get("timestamp", ""),
+                "decision_type": row.get("decision_type") or "unknown",
+                "outcome": row.get("outcome") or "unknown",
+                "reasoning": row.get("reasoning") or "",
+                "risk_score": float(row.get("risk_score") or 0),
+                "timestamp": row.get("timestamp") or "",
             }
-        except (IndexError, Exception):
-            return None
+            for row in (rows.get(order_id) for order_id in order_ids)
+            if row is not None
+        ]
 
     def _build_actions_from_orders(
         self, orders: list[dict[str, Any]], insight: CopilotInsight
@@ -47,6 +47,10 @@ def configure_logging(environment: str, log_level: str = "INFO") -> None:
     """
     # Determine output format based on environment
     is_production = environment == "production"
+    log_level = log_level.upper()
+    level = logging.getLevelName(log_level)
+    if not isinstance(level, int):
+        log_level, level = "INFO", logging.INFO
 
     # Configure standard library logging
     logging_config = {
@@ -73,7 +77,6 @@ def configure_logging(environment: str, log_level: str = "INFO") -> None:
             },
             # Quiet noisy loggers
             "asyncio": {"level": "WARNING"},
-            "uvicorn.access": {"level": "WARNING"},
         },
     }
 
@@ -88,15 +91,17 @@ def configure_logging(environment: str, log_level: str = "INFO") -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             # Add log level
             structlog.processors.add_log_level,
-            # Convert exceptions to strings
-            structlog.processors.ExceptionFormatter(),
-            # For production: JSON output
-            # For development: colored console output
-            structlog.processors.JSONRenderer()
-            if is_production
-            else structlog.dev.ConsoleRenderer(),
+            # For production: exceptions as strings, then JSON output
+            # For development: colored console output (renders exceptions itself)
+            *(
+                [structlog.processors.format_exc_info, structlog.processors.JSONRenderer()]
+                if is_production
+                else [structlog.dev.ConsoleRenderer()]
+            ),
         ],
-        context_class=structlog.contextvars.as_immutable_dict,
+        # Calls below log_level return before any processor runs, so
+        # suppressed events cost no timestamping or rendering.
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=False,
     )
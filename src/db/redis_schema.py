@@ -111,11 +111,6 @@ class FeatureCacheDict(TypedDict, total=False):
 
 
 FEATURES_CACHE_KEY_PATTERN = "features:{order_id}"
-
-
-def get_features_key(order_id: str) -> str:
-    """Return the Redis key for an order's pre-computed ML features."""
-    return FEATURES_CACHE_KEY_PATTERN.format(order_id=order_id)
 """
 Pattern: features:{order_id}
 Type: Redis Hash
@@ -181,6 +176,28 @@ Example key: decision:550e8400-e29b-41d4-a716-446655440000
 DECISION_CACHE_TTL_SECONDS = 2 * 60  # 2 minutes
 
 
+# ============================================================================
+# PREDICTION EXPLANATIONS (Deferred SHAP factors)
+# ============================================================================
+
+EXPLANATION_KEY_PATTERN = "explanation:{tenant_id}:{order_id}"
+"""
+Pattern: explanation:{tenant_id}:{order_id}
+Type: Redis String (JSON: {"status": "ready" | "failed", "topRiskFactors": [...]})
+TTL: 5 minutes
+
+SHAP top risk factors computed in the background when
+GET /predictions/{order_id} is called with explain=false.
+Read back via GET /predictions/{order_id}/explanation, only under the
+caller's tenant. A failed SHAP run is stored as status="failed" so readers
+stop polling.
+
+Example key: explanation:tenant-123:550e8400-e29b-41d4-a716-446655440000
+"""
+
+EXPLANATION_TTL_SECONDS = 5 * 60  # 5 minutes
+
+
 # ============================================================================
 # PUB/SUB CHANNELS (WebSocket Broadcasting)
 # ============================================================================
@@ -340,6 +357,14 @@ REDIS_KEY_PATTERNS = [
         example_key="decision:550e8400-e29b-41d4-a716-446655440000",
         multi_tenant=True,
     ),
+    RedisKeyPattern(
+        pattern=EXPLANATION_KEY_PATTERN,
+        key_type="string",
+        ttl_seconds=EXPLANATION_TTL_SECONDS,
+        description="Deferred SHAP risk factors for the latest prediction",
+        example_key="explanation:tenant-123:550e8400-e29b-41d4-a716-446655440000",
+        multi_tenant=True,
+    ),
     RedisKeyPattern(
         pattern=DRIVER_SESSION_KEY_PATTERN,
         key_type="hash",
@@ -426,6 +451,20 @@ def get_fleet_positions_key(tenant_id: str) -> str:
     return FLEET_POSITIONS_KEY_PATTERN.format(tenant_id=tenant_id)
 
 
+def get_explanation_key(tenant_id: str, order_id: str) -> str:
+    """
+    Return the Redis key for an order's deferred SHAP explanation.
+
+    Pattern: explanation:{tenant_id}:{order_id}
+    TTL: EXPLANATION_TTL_SECONDS (5 minutes)
+
+    Example:
+        >>> get_explanation_key("tenant-1", "order-1")
+        'explanation:tenant-1:order-1'
+    """
+    return EXPLANATION_KEY_PATTERN.format(tenant_id=tenant_id, order_id=order_id)
+
+
 def get_prediction_updates_channel() -> str:
     """Return the pub/sub channel name for prediction updates."""
     return "predictions:updates"
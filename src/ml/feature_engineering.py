@@ -7,6 +7,7 @@ This consistency is critical to avoid training/serving skew.
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -21,6 +22,30 @@ class FeatureStats:
     feature_maxs: dict[str, float]
 
 
+# Peak hours for delivery (7-9am, 5-8pm typical rush)
+PEAK_HOURS = frozenset({7, 8, 9, 17, 18, 19, 20})
+
+
+@lru_cache(maxsize=256)
+def temporal_features(hour: int, day_of_week: int) -> tuple[float, float, float, float, float]:
+    """
+    Cyclic temporal encoding for an (hour, day_of_week) pair.
+
+    Pure in its two small-integer inputs, so repeat calls are a cache hit
+    instead of four trig evaluations.
+
+    Returns:
+        (hour_sin, hour_cos, is_peak_hour, dow_sin, dow_cos)
+    """
+    return (
+        math.sin(2 * math.pi * hour / 24.0),
+        math.cos(2 * math.pi * hour / 24.0),
+        1.0 if hour in PEAK_HOURS else 0.0,
+        math.sin(2 * math.pi * day_of_week / 7.0),
+        math.cos(2 * math.pi * day_of_week / 7.0),
+    )
+
+
 class FeatureBuilder:
     """
     Build identical feature sets for training and inference.
@@ -52,7 +77,7 @@ class FeatureBuilder:
     ]
     
     # Peak hours for delivery (7-9am, 5-8pm typical rush)
-    PEAK_HOURS = {7, 8, 9, 17, 18, 19, 20}
+    PEAK_HOURS = PEAK_HOURS
     
     # Expected speeds for different road types (km/h)
     EXPECTED_SPEEDS = {
@@ -157,22 +182,98 @@ class FeatureBuilder:
         # ===== Temporal Features (Cyclic Encoding) =====
         
         hour = int(row.get("hour_of_day_start", 12))
-        hour_sin = math.sin(2 * math.pi * hour / 24.0)
-        hour_cos = math.cos(2 * math.pi * hour / 24.0)
+        dow = int(row.get("day_of_week", 2))
+        hour_sin, hour_cos, is_peak, dow_sin, dow_cos = temporal_features(hour, dow)
         features["hour_of_day_sin"] = hour_sin
         features["hour_of_day_cos"] = hour_cos
-        
-        is_peak = 1.0 if hour in self.PEAK_HOURS else 0.0
         features["is_peak_hour"] = is_peak
-        
-        dow = int(row.get("day_of_week", 2))
-        dow_sin = math.sin(2 * math.pi * dow / 7.0)
-        dow_cos = math.cos(2 * math.pi * dow / 7.0)
         features["day_of_week_sin"] = dow_sin
         features["day_of_week_cos"] = dow_cos
         
         return self._order_features(features)
     
+    def build_matrix_from_historical(
+        self,
+        df: pd.DataFrame,
+        dtype: Any = np.float32,
+    ) -> np.ndarray:
+        """
+        Build the (N, 14) feature matrix for a frame of historical records.
+
+        Column-wise equivalent of calling build_from_historical on every row:
+        same defaults and clamping, computed as NumPy array ops instead of a
+        per-row pandas Series lookup and dict. Columns are in FEATURE_NAMES
+        order. float32 matches what XGBoost trains on internally.
+
+        Args:
+            df: DataFrame with the columns documented on build_from_historical
+            dtype: Output dtype
+
+        Returns:
+            Feature matrix of shape (len(df), len(FEATURE_NAMES))
+        """
+        n_rows = len(df)
+
+        def column(name: str, default: float) -> np.ndarray:
+            if name in df.columns:
+                return df[name].to_numpy(dtype=np.float64)
+            return np.full(n_rows, default, dtype=np.float64)
+
+        X = np.empty((n_rows, len(self.FEATURE_NAMES)), dtype=dtype)
+
+        # ===== Order Progress Features =====
+        # int() truncation, then the same clamps as the per-row builder.
+        # np.maximum/np.minimum propagate NaN, so a corrupt input stays NaN
+        # in every feature derived from it and validate_matrix rejects the
+        # row, where the per-row builder would fail on int(NaN).
+        planned_stops = np.maximum(np.trunc(column("planned_stops", 1)), 1.0)
+        completed_stops = np.maximum(np.trunc(column("completed_stops", 0)), 0.0)
+        stops_remaining_ratio = np.maximum(0.0, 1.0 - completed_stops / planned_stops)
+
+        planned_duration = np.maximum(column("planned_duration_minutes", 1), 1.0)
+        if "actual_duration_minutes" in df.columns:
+            actual_duration = df["actual_duration_minutes"].to_numpy(dtype=np.float64)
+        else:
+            actual_duration = planned_duration
+        time_elapsed_ratio = np.minimum(1.0, actual_duration / planned_duration)
+
+        X[:, 0] = stops_remaining_ratio
+        X[:, 1] = time_elapsed_ratio
+        X[:, 2] = time_elapsed_ratio / np.maximum(stops_remaining_ratio, 0.01)
+
+        # ===== Stop Behavior =====
+        X[:, 3] = column("stop_dwell_time_avg_minutes", 5.0)
+
+        # ===== GPS/Speed Context =====
+        current_speed = column("avg_speed_kmh", 35.0)
+        expected_speed = max(self.EXPECTED_SPEEDS["urban"], 1.0)
+        X[:, 4] = current_speed
+        X[:, 5] = current_speed / expected_speed
+        X[:, 6] = column("route_deviation_meters", 0.0)
+        X[:, 7] = (current_speed - expected_speed) / expected_speed
+
+        # ===== Driver Context =====
+        X[:, 8] = column("driver_historical_on_time_rate", 0.85)
+
+        # ===== Temporal Features (Cyclic Encoding) =====
+        # At most 24 hours and 7 weekdays occur, so encode the distinct
+        # values once and broadcast back with the inverse index.
+        hours, hour_idx = np.unique(
+            np.trunc(column("hour_of_day_start", 12)), return_inverse=True
+        )
+        dows, dow_idx = np.unique(
+            np.trunc(column("day_of_week", 2)), return_inverse=True
+        )
+        hour_angle = 2 * np.pi * hours / 24.0
+        dow_angle = 2 * np.pi * dows / 7.0
+        X[:, 9] = np.sin(hour_angle)[hour_idx]
+        X[:, 10] = np.cos(hour_angle)[hour_idx]
+        X[:, 11] = np.isin(hours, list(self.PEAK_HOURS))[hour_idx]
+        X[:, 12] = np.sin(dow_angle)[dow_idx]
+        X[:, 13] = np.cos(dow_angle)[dow_idx]
+
+        return X
+
     def build_from_live(
         self,
         order_state: dict[str, Any],
@@ -241,15 +342,10 @@ class FeatureBuilder:
         
         # speed_trend: compute from last 5 pings if available
         if gps_pings and len(gps_pings) >= 2:
-            speeds = [p.get("speed_kmh", 0) for p in gps_pings[-5:]]
-            # Fit linear trend
-            if len(speeds) >= 2:
-                x = np.arange(len(speeds))
-                y = np.array(speeds)
-                # Simple slope: (y[-1] - y[0]) / len(y)
-                trend = (speeds[-1] - speeds[0]) / max(len(speeds), 1)
-            else:
-                trend = 0.0
+            recent = gps_pings[-5:]
+            # Simple slope: (last - first) / window size. At most five
+            # points, so plain arithmetic beats allocating NumPy arrays.
+            trend = (recent[-1].get("speed_kmh", 0) - recent[0].get("speed_kmh", 0)) / len(recent)
         else:
             trend = 0.0
         features["speed_trend"] = trend
@@ -262,17 +358,11 @@ class FeatureBuilder:
         # ===== Temporal Features =====
         
         hour = int(order_state.get("hour_of_day", 12))
-        hour_sin = math.sin(2 * math.pi * hour / 24.0)
-        hour_cos = math.cos(2 * math.pi * hour / 24.0)
+        dow = int(order_state.get("day_of_week", 2))
+        hour_sin, hour_cos, is_peak, dow_sin, dow_cos = temporal_features(hour, dow)
         features["hour_of_day_sin"] = hour_sin
         features["hour_of_day_cos"] = hour_cos
-        
-        is_peak = 1.0 if hour in self.PEAK_HOURS else 0.0
         features["is_peak_hour"] = is_peak
-        
-        dow = int(order_state.get("day_of_week", 2))
-        dow_sin = math.sin(2 * math.pi * dow / 7.0)
-        dow_cos = math.cos(2 * math.pi * dow / 7.0)
         features["day_of_week_sin"] = dow_sin
         features["day_of_week_cos"] = dow_cos
         
@@ -314,12 +404,12 @@ class FeatureBuilder:
             
             value = features[name]
             
-            # Check NaN
-            if pd.isna(value):
+            # Check NaN (scalar math checks; this runs per feature per request)
+            if value is None or math.isnan(value):
                 raise ValueError(f"Feature {name} is NaN")
             
             # Check infinite
-            if np.isinf(value):
+            if math.isinf(value):
                 raise ValueError(f"Feature {name} is infinite")
             
             # Check reasonable ranges (loose bounds)
@@ -330,6 +420,33 @@ class FeatureBuilder:
         
         return True
     
+    def validate_matrix(self, X: np.ndarray) -> bool:
+        """
+        Validate a feature matrix with the same rules as validate_features.
+
+        Args:
+            X: Matrix from build_matrix_from_historical
+
+        Returns:
+            True if valid
+
+        Raises:
+            ValueError naming the first offending row and feature
+        """
+        checks = (
+            (np.isnan(X), "is NaN"),
+            (np.isinf(X), "is infinite"),
+            (np.abs(X) > 1e6, "is out of reasonable range"),
+        )
+        for mask, reason in checks:
+            if mask.any():
+                row, col = np.argwhere(mask)[0]
+                raise ValueError(
+                    f"Feature {self.FEATURE_NAMES[col]} = {X[row, col]} {reason} (row {row})"
+                )
+
+        return True
+
     def compute_feature_stats(self, df: pd.DataFrame) -> FeatureStats:
         """
         Compute feature statistics from training data for imputation.
@@ -340,24 +457,19 @@ class FeatureBuilder:
         Returns:
             FeatureStats for use in inference
         """
-        # Build features for all training rows
-        feature_rows = []
-        for _, row in df.iterrows():
-            try:
-                features = self.build_from_historical(row)
-                feature_rows.append(features)
-            except Exception:
-                continue
-        
-        if not feature_rows:
+        if df.empty:
             raise ValueError("Could not compute features from any training rows")
         
-        features_df = pd.DataFrame(feature_rows)
+        # One vectorised pass instead of an iterrows() dict per row and a
+        # second DataFrame; float64 keeps the statistics at full precision.
+        # A NaN input leaves NaN in the features derived from it, and those
+        # cells are skipped per feature rather than clamped into the stats.
+        X = self.build_matrix_from_historical(df, dtype=np.float64)
         
         stats = FeatureStats(
-            feature_medians=features_df.median().to_dict(),
-            feature_mins=features_df.min().to_dict(),
-            feature_maxs=features_df.max().to_dict(),
+            feature_medians=dict(zip(self.FEATURE_NAMES, np.nanmedian(X, axis=0).tolist())),
+            feature_mins=dict(zip(self.FEATURE_NAMES, np.nanmin(X, axis=0).tolist())),
+            feature_maxs=dict(zip(self.FEATURE_NAMES, np.nanmax(X, axis=0).tolist())),
         )
         
         return stats
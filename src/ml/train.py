@@ -86,29 +86,23 @@ def load_and_split_data(
 def build_feature_matrix(
     df: pd.DataFrame,
     builder: FeatureBuilder,
-) -> tuple[np.ndarray, list[dict[str, float]]]:
+) -> np.ndarray:
     """
     Build feature matrix from dataframe.
     
+    Features are computed column-wise over the whole frame rather than one
+    iterrows() Series at a time.
+    
     Args:
         df: DataFrame with delivery records
         builder: FeatureBuilder instance
     
     Returns:
-        (X: feature matrix, features_list: list of feature dicts for inspection)
+        X: float32 feature matrix with columns in builder.get_feature_names() order
     """
-    features_list = []
-    
-    for _, row in df.iterrows():
-        features = builder.build_from_historical(row)
-        builder.validate_features(features)
-        features_list.append(features)
-    
-    # Convert to numpy array with features in consistent order
-    feature_names = builder.get_feature_names()
-    X = np.array([[f[name] for name in feature_names] for f in features_list])
-    
-    return X, features_list
+    X = builder.build_matrix_from_historical(df)
+    builder.validate_matrix(X)
+    return X
 
 
 def get_class_weights(y: np.ndarray) -> float:
@@ -399,8 +393,8 @@ def train_model(
     builder = FeatureBuilder()
     feature_names = builder.get_feature_names()
     
-    X_train, _ = build_feature_matrix(df_train, builder)
-    X_test, _ = build_feature_matrix(df_test, builder)
+    X_train = build_feature_matrix(df_train, builder)
+    X_test = build_feature_matrix(df_test, builder)
     
     y_train = df_train["was_late"].astype(int).values
     y_test = df_test["was_late"].astype(int).values
@@ -502,6 +496,9 @@ def train_model(
     # Model
     import joblib
     joblib.dump(model, output_path / "model.joblib")
+    # Native format for inference: loads without unpickling and is
+    # readable across XGBoost versions.
+    model.save_model(str(output_path / "model.ubj"))
     
     # Feature names
     with open(output_path / "feature_names.json", "w") as f:
@@ -557,7 +554,7 @@ def train_model(
     with open(output_path / "training_metadata.json", "w") as f:
         json.dump(metadata, f, indent=2)
     
-    print(f"[OK] Model saved to {output_path / 'model.joblib'}")
+    print(f"[OK] Model saved to {output_path / 'model.joblib'} and {output_path / 'model.ubj'}")
     print(f"[OK] Metadata saved to {output_path / 'training_metadata.json'}")
     
     # ===== MLflow Tracking =====
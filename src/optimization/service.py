@@ -12,7 +12,10 @@ Key principle: Never block the API thread.
 All I/O operations are async (Redis, database queries).
 """
 
+import asyncio
+import json
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -26,6 +29,41 @@ from src.optimization.solver import RoutingProblem, RoutingResult, VRPSolver
 
 logger = structlog.get_logger(__name__)
 
+# Inline (non-Celery) solves run on the default thread pool inside the API
+# process. Cap how many a single tenant can have in flight so one tenant's
+# burst cannot occupy every worker thread while the broker is down.
+MAX_INLINE_SOLVES_PER_TENANT = 2
+
+
+@dataclass
+class _TenantSolveSlots:
+    """A tenant's inline solve semaphore and how many jobs hold or await it."""
+
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+# Entries exist only while a tenant has inline jobs in flight or queued.
+_inline_solve_slots: dict[str, _TenantSolveSlots] = {}
+
+
+@asynccontextmanager
+async def _inline_solve_slot(tenant_id: str):
+    """Hold one of the tenant's inline solve slots; drop the entry once idle."""
+    slots = _inline_solve_slots.get(tenant_id)
+    if slots is None:
+        slots = _inline_solve_slots[tenant_id] = _TenantSolveSlots(
+            asyncio.Semaphore(MAX_INLINE_SOLVES_PER_TENANT)
+        )
+    slots.users += 1
+    try:
+        async with slots.semaphore:
+            yield
+    finally:
+        slots.users -= 1
+        if slots.users == 0:
+            del _inline_solve_slots[tenant_id]
+
 
 class JobStatus(str, Enum):
     """Status of an optimization job."""
@@ -173,7 +211,6 @@ class OptimizationService:
 
         # Run solver inline when Celery is unavailable or unreachable.
         if not celery_submitted:
-            import asyncio
             asyncio.create_task(self._execute_job(job_id, redis_key, problem, order_id, tenant_id))
 
         logger.info(
@@ -188,25 +225,12 @@ class OptimizationService:
 
     async def _execute_job(self, job_id: str, redis_key: str, problem: RoutingProblem, order_id: str, tenant_id: str) -> None:
         """Execute solver inline as a background task, save to DB, and publish event."""
-        import json
-        import asyncio
         from src.db.redis_schema import get_shipment_updates_channel
         from sqlalchemy import text
-        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-        from sqlalchemy.orm import sessionmaker
-        from src.core.config import get_settings
-
-        db_url = get_settings(allow_defaults=True).database_url
-        if not db_url:
-            raise RuntimeError(
-                "DATABASE_URL is not configured. "
-                "This is a security-critical setting that must be provided via environment variable."
-            )
+        from src.api.deps import get_session_maker
 
         try:
-            await self.redis_client.hset(redis_key, mapping={"status": JobStatus.RUNNING.value, "started_at": datetime.now(timezone.utc).isoformat()})
-
-            result = await asyncio.to_thread(self.solver.solve, problem)
+            result = await self._solve_inline(redis_key, tenant_id, problem)
 
             result_dict = {
                 "ordered_stops": result.ordered_stops,
@@ -219,33 +243,36 @@ class OptimizationService:
 
             # Build waypoints for event and DB
             stop_lookup = {s.stop_id: s for s in problem.stops}
-            waypoints = []
-            for seq, stop_id in enumerate(result.ordered_stops, start=1):
-                orig = stop_lookup.get(stop_id)
-                if orig:
-                    waypoints.append({
-                        "lat": orig.lat, "lng": orig.lng,
-                        "order_id": getattr(orig, 'order_id', None),
-                        "sequence": seq, "type": "stop",
-                    })
+            sequenced_stops = [
+                (seq, stop_id, stop_lookup.get(stop_id))
+                for seq, stop_id in enumerate(result.ordered_stops, start=1)
+            ]
+            waypoints = [
+                {
+                    "lat": orig.lat, "lng": orig.lng,
+                    "order_id": getattr(orig, 'order_id', None),
+                    "sequence": seq, "type": "stop",
+                }
+                for seq, _, orig in sequenced_stops
+                if orig
+            ]
 
             # Save to PostgreSQL route_plans table
             try:
-                engine = create_async_engine(db_url)
-                async_session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-                async with async_session_factory() as db:
+                # Shared API pool; raises if DATABASE_URL is unset, which the
+                # except below logs as a skipped save.
+                async with get_session_maker()() as db:
                     # Store waypoints as dicts with lat/lng (not just string IDs)
-                    db_waypoints = []
-                    for seq, stop_id in enumerate(result.ordered_stops, start=1):
-                        s = stop_lookup.get(stop_id)
-                        if s and hasattr(s, 'lat'):
-                            db_waypoints.append({
-                                "stop_id": stop_id,
-                                "lat": s.lat, "lng": s.lng,
-                                "sequence": seq, "type": "stop",
-                            })
-                        else:
-                            db_waypoints.append({"stop_id": stop_id, "sequence": seq, "type": "stop"})
+                    db_waypoints = [
+                        {
+                            "stop_id": stop_id,
+                            "lat": s.lat, "lng": s.lng,
+                            "sequence": seq, "type": "stop",
+                        }
+                        if s and hasattr(s, 'lat')
+                        else {"stop_id": stop_id, "sequence": seq, "type": "stop"}
+                        for seq, stop_id, s in sequenced_stops
+                    ]
                     await db.execute(
                         text("""
                             INSERT INTO route_plans (id, order_id, tenant_id, waypoints, total_distance_km,
@@ -264,7 +291,6 @@ class OptimizationService:
                         },
                     )
                     await db.commit()
-                await engine.dispose()
             except Exception as db_err:
                 logger.warning("solver_db_save_skipped", job_id=job_id, error=str(db_err))
 
@@ -344,7 +370,6 @@ class OptimizationService:
 
         # If result available, reconstruct RoutingResult
         if "result" in data and data["result"]:
-            import json
             result_dict = json.loads(data["result"])
             metadata.result = RoutingResult(**result_dict)
 
@@ -353,6 +378,17 @@ class OptimizationService:
 
         return metadata
 
+    async def _solve_inline(self, redis_key: str, tenant_id: str, problem: RoutingProblem) -> RoutingResult:
+        """
+        Run the solver in a worker thread, bounded per tenant.
+
+        The job stays pending while it waits for a slot and is only marked
+        running once it holds one.
+        """
+        async with _inline_solve_slot(tenant_id):
+            await self.redis_client.hset(redis_key, mapping={"status": JobStatus.RUNNING.value, "started_at": datetime.now(timezone.utc).isoformat()})
+            return await asyncio.to_thread(self.solver.solve, problem)
+
     async def run_solver_sync(self, problem: RoutingProblem) -> RoutingResult:
         """
         Run the solver synchronously in a thread pool.
@@ -370,8 +406,6 @@ class OptimizationService:
             This blocks the current task for 200-2000ms but not the entire
             event loop. Use judiciously (only when time-critical routing needed).
         """
-        import asyncio
-
         # Run solver in thread pool
         result = await asyncio.to_thread(self.solver.solve, problem)
 
@@ -413,7 +447,6 @@ class OptimizationService:
         if status == JobStatus.COMPLETED:
             update_dict["completed_at"] = datetime.now(timezone.utc).isoformat()
             if result:
-                import json
                 result_dict = {
                     "ordered_stops": result.ordered_stops,
                     "total_distance_km": result.total_distance_km,
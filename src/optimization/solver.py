@@ -12,13 +12,18 @@ Key principle: Always returns a result within timeout_seconds.
 Never raises an exception for solver failures.
 """
 
+import hashlib
+import itertools
 import math
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
 import structlog
+from cachetools import LRUCache
 from ortools.linear_solver import pywraplp
 from ortools.constraint_solver import pywrapcp, routing_enums_pb2
 
@@ -64,6 +69,8 @@ class RoutingResult:
 
 # ===== Helper Functions =====
 
+_EARTH_RADIUS_M = 6371000  # Earth radius in meters
+
 
 def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """
@@ -71,7 +78,7 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
 
     Uses Haversine formula. Returns distance in meters.
     """
-    R = 6371000  # Earth radius in meters
+    R = _EARTH_RADIUS_M
     dlat = math.radians(lat2 - lat1)
     dlng = math.radians(lng2 - lng1)
     a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(
@@ -99,31 +106,50 @@ def get_distance_matrix(
     - Mapbox
     This would give accurate turn-by-turn distances and respect road networks.
     """
-    urban_factor = 1.3  # Road distance is ~1.3x crow-flies in urban areas
+    return _distance_matrix_array(origin_lat, origin_lng, stops).tolist()
 
-    # Include origin + all stops
-    locations = [(origin_lat, origin_lng)] + [(s.lat, s.lng) for s in stops]
-    n = len(locations)
-
-    # Build distance matrix (meters as integers, required by OR-Tools)
-    matrix = []
-    for i in range(n):
-        row = []
-        for j in range(n):
-            if i == j:
-                distance = 0
-            else:
-                crowflies = haversine_distance(
-                    locations[i][0],
-                    locations[i][1],
-                    locations[j][0],
-                    locations[j][1],
-                )
-                distance = int(crowflies * urban_factor)
-            row.append(distance)
-        matrix.append(row)
 
-    return matrix
+def _distance_matrix_array(
+    origin_lat: float, origin_lng: float, stops: list[RoutingStop]
+) -> np.ndarray:
+    """get_distance_matrix as an int64 array, before conversion to lists."""
+    urban_factor = 1.3  # Road distance is ~1.3x crow-flies in urban areas
+
+    # Include origin + all stops, converted to radians in place
+    lats = np.fromiter(
+        itertools.chain((origin_lat,), (s.lat for s in stops)),
+        dtype=np.float64,
+        count=len(stops) + 1,
+    )
+    lngs = np.fromiter(
+        itertools.chain((origin_lng,), (s.lng for s in stops)),
+        dtype=np.float64,
+        count=len(stops) + 1,
+    )
+    np.radians(lats, out=lats)
+    np.radians(lngs, out=lngs)
+
+    # All-pairs haversine in one broadcast pass instead of n^2 scalar calls
+    # (same formula as haversine_distance; the diagonal is exactly 0).
+    # cos(lat) is taken once per point and reused for every pair it appears in.
+    # The two (n, n) difference arrays are the only full-size allocations;
+    # every later step works in place on them.
+    cos_lat = np.cos(lats)
+    dlat = lats[None, :] - lats[:, None]
+    dlng = lngs[None, :] - lngs[:, None]
+    for delta in (dlat, dlng):
+        delta *= 0.5
+        np.sin(delta, out=delta)
+        np.square(delta, out=delta)
+    dlng *= cos_lat[:, None]
+    dlng *= cos_lat[None, :]
+    a = np.add(dlat, dlng, out=dlat)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * _EARTH_RADIUS_M * urban_factor
+
+    # Meters as integers (truncated), required by OR-Tools
+    return a.astype(np.int64)
 
 
 def get_time_matrix(distance_matrix: list[list[int]]) -> list[list[int]]:
@@ -133,15 +159,48 @@ def get_time_matrix(distance_matrix: list[list[int]]) -> list[list[int]]:
     Assumes average speed of 40 km/h in urban areas.
     Distance in meters / 40 km/h = seconds.
     """
+    return _time_matrix_array(np.asarray(distance_matrix, dtype=np.int64)).tolist()
+
+
+def _time_matrix_array(distances: np.ndarray) -> np.ndarray:
+    """get_time_matrix on an int64 distance array, returning int64 seconds."""
     speed_kmh = 40
     speed_m_per_sec = speed_kmh * 1000 / 3600  # Convert km/h to m/s
 
-    time_matrix = []
-    for row in distance_matrix:
-        time_row = [max(1, int(d / speed_m_per_sec)) for d in row]  # At least 1 second
-        time_matrix.append(time_row)
-
-    return time_matrix
+    seconds = distances.astype(np.float64)
+    seconds /= speed_m_per_sec
+    # Truncate like int(), then at least 1 second per arc
+    times = seconds.astype(np.int64)
+    np.maximum(times, 1, out=times)
+    return times
+
+
+# Solved results keyed by a digest of the problem. The agent re-requests a
+# route for the same driver position and pending stops on successive ticks;
+# an identical problem returns the earlier solution instead of running
+# another OR-Tools search of up to timeout_seconds. Only solved results are
+# cached. solve() runs in worker threads, hence the lock.
+SOLUTION_CACHE_SIZE = 256
+_solution_cache: LRUCache = LRUCache(maxsize=SOLUTION_CACHE_SIZE)
+_solution_cache_lock = threading.Lock()
+
+
+def _problem_cache_key(problem: RoutingProblem, timeout_seconds: int) -> bytes:
+    """Stable digest of everything that influences the solver's answer."""
+    stops = tuple(
+        (
+            s.stop_id,
+            s.lat,
+            s.lng,
+            s.demand,
+            s.service_time_minutes,
+            s.time_window_start.timestamp() if s.time_window_start else None,
+            s.time_window_end.timestamp() if s.time_window_end else None,
+        )
+        for s in problem.stops
+    )
+    raw = repr((tuple(problem.origin), stops, problem.vehicle_capacity, timeout_seconds))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
 
 
 # ===== VRP Solver =====
@@ -214,9 +273,21 @@ class VRPSolver:
                     solver_duration_ms=int((time.time() - start_time) * 1000),
                 )
 
-            # Build distance matrix
-            distance_matrix = get_distance_matrix(problem.origin[0], problem.origin[1], problem.stops)
-            time_matrix = get_time_matrix(distance_matrix)
+            cache_key = _problem_cache_key(problem, self.timeout_seconds)
+            with _solution_cache_lock:
+                cached = _solution_cache.get(cache_key)
+            if cached is not None:
+                return replace(
+                    cached,
+                    ordered_stops=list(cached.ordered_stops),
+                    solver_duration_ms=int((time.time() - start_time) * 1000),
+                )
+
+            # Build distance and time matrices from one array; lists are kept
+            # for OR-Tools' per-arc callbacks, where list indexing is fastest.
+            distances = _distance_matrix_array(problem.origin[0], problem.origin[1], problem.stops)
+            distance_matrix = distances.tolist()
+            time_matrix = _time_matrix_array(distances).tolist()
 
             # Create routing index manager
             manager = pywrapcp.RoutingIndexManager(
@@ -228,10 +299,14 @@ class VRPSolver:
             # Create routing model
             routing = pywrapcp.RoutingModel(manager)
 
+            # OR-Tools invokes the transit callbacks for every arc it evaluates,
+            # so bind loop-invariant lookups once instead of per call.
+            index_to_node = manager.IndexToNode
+
             # Set cost function: use time as primary cost
             def time_callback(from_index, to_index):
                 """Return time between locations in seconds."""
-                return time_matrix[manager.IndexToNode(from_index)][manager.IndexToNode(to_index)]
+                return time_matrix[index_to_node(from_index)][index_to_node(to_index)]
 
             callback_index = routing.RegisterTransitCallback(time_callback)
             routing.SetArcCostEvaluatorOfAllVehicles(callback_index)
@@ -272,12 +347,11 @@ class VRPSolver:
 
             # Add vehicle capacity if specified
             if problem.vehicle_capacity:
+                demands = [0] + [stop.demand for stop in problem.stops]  # origin has no demand
+
                 def demand_callback(from_index):
                     """Return demand at location."""
-                    node = manager.IndexToNode(from_index)
-                    if node == 0:
-                        return 0  # origin has no demand
-                    return problem.stops[node - 1].demand
+                    return demands[index_to_node(from_index)]
 
                 demand_callback_index = routing.RegisterTransitCallback(demand_callback)
                 routing.AddDimension(
@@ -335,7 +409,7 @@ class VRPSolver:
                 # OR-Tools Python wrappers differ across versions; mark solved results as feasible.
                 solver_status = "feasible"
 
-                return RoutingResult(
+                result = RoutingResult(
                     ordered_stops=ordered_stops,
                     total_distance_km=total_distance_km,
                     total_duration_minutes=max(0, total_duration_minutes),
@@ -343,6 +417,9 @@ class VRPSolver:
                     solver_status=solver_status,
                     solver_duration_ms=int((time.time() - start_time) * 1000),
                 )
+                with _solution_cache_lock:
+                    _solution_cache[cache_key] = result
+                return replace(result, ordered_stops=list(ordered_stops))
             else:
                 # No solution found
                 solver_duration_ms = int((time.time() - start_time) * 1000)
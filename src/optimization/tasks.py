@@ -9,14 +9,11 @@ Publishes completion events to Redis pub/sub for real-time updates.
 import json
 import os
 from datetime import datetime, timezone
-from typing import Optional
 
 import structlog
-from celery import Celery, shared_task
+from celery import Celery
 from celery.exceptions import SoftTimeLimitExceeded
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
 from src.core.config import get_settings
 from src.optimization.solver import (
@@ -24,7 +21,7 @@ from src.optimization.solver import (
     RoutingStop,
     VRPSolver,
 )
-from src.optimization.service import OptimizationService, JobStatus
+from src.optimization.service import JobStatus
 from src.db.redis_schema import get_shipment_updates_channel
 
 logger = structlog.get_logger(__name__)
@@ -39,12 +36,59 @@ celery_app = Celery(
 celery_app.conf.result_backend = _settings.celery_result_backend or _settings.redis_url or "redis://localhost:6379/0"
 
 
+_sync_engine = None
+
+
+def _get_sync_engine(db_url: str):
+    """
+    Return the worker's shared synchronous engine, creating it on first use.
+
+    Celery workers are long-lived, so one pooled engine per process replaces
+    a fresh engine (and connection pool) per task. On psycopg2,
+    executemany_mode="values_plus_batch" also pages executemany UPDATE/DELETE
+    statements instead of sending one round-trip per parameter set.
+    """
+    global _sync_engine
+    if _sync_engine is None:
+        from sqlalchemy import create_engine
+        from sqlalchemy.engine import make_url
+
+        engine_kwargs: dict = {"pool_pre_ping": True}
+        if make_url(db_url).get_driver_name() == "psycopg2":
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+        _sync_engine = create_engine(db_url, **engine_kwargs)
+    return _sync_engine
+
+
+_sync_redis = None
+
+
+def _get_sync_redis():
+    """
+    Return the worker's shared synchronous Redis client, creating it on first use.
+
+    The client owns a connection pool, so reusing it across tasks keeps the
+    connection to Redis open instead of reconnecting for every job.
+    """
+    global _sync_redis
+    if _sync_redis is None:
+        import redis
+
+        _sync_redis = redis.Redis.from_url(
+            _settings.redis_url or "redis://localhost:6379/0", decode_responses=True
+        )
+    return _sync_redis
+
+
 @celery_app.task(
     bind=True,
     max_retries=2,
     soft_time_limit=8,  # 8 seconds soft limit (sends SoftTimeLimitExceeded)
     time_limit=10,  # 10 seconds hard limit (kills worker)
-    track_started=True,
+    # Status and results are published through the optimization:job:{id}
+    # hash and pub/sub; nothing reads the Celery result backend, so skip
+    # serialising the return value and state transitions into it.
+    ignore_result=True,
 )
 def solve_routing_job(
     self,
@@ -77,9 +121,7 @@ def solve_routing_job(
     Raises:
         Retries up to max_retries on any exception
     """
-    import redis
-
-    redis_client = redis.Redis.from_url(_settings.redis_url or "redis://localhost:6379/0", decode_responses=True)
+    redis_client = _get_sync_redis()
     solver = VRPSolver(timeout_seconds=5)
     db_url = _settings.database_url or os.getenv("DATABASE_URL")
     if not db_url:
@@ -139,9 +181,8 @@ def solve_routing_job(
                 "This is a security-critical setting that must be provided via environment variable."
             )
         sync_db_url = sync_db_url.replace("+asyncpg", "+psycopg2")
-        from sqlalchemy import create_engine
         from sqlalchemy.orm import Session as SyncSession
-        sync_engine = create_engine(sync_db_url)
+        sync_engine = _get_sync_engine(sync_db_url)
         try:
             with SyncSession(sync_engine) as db:
                 db.execute(
@@ -178,16 +219,18 @@ def solve_routing_job(
         # ===== STEP 5: Update Redis status to "completed" =====
         # Build proper waypoints with lat/lng from ordered stop IDs
         stop_lookup = {s["stop_id"]: s for s in problem_dict["stops"]}
-        waypoints = []
-        for seq, stop_id in enumerate(result.ordered_stops, start=1):
-            orig = stop_lookup.get(stop_id, {})
-            waypoints.append({
+        waypoints = [
+            {
                 "lat": orig.get("lat", 0.0),
                 "lng": orig.get("lng", 0.0),
                 "order_id": order_id,
                 "sequence": seq,
                 "type": "stop",
-            })
+            }
+            for seq, orig in enumerate(
+                (stop_lookup.get(stop_id, {}) for stop_id in result.ordered_stops), start=1
+            )
+        ]
 
         result_dict = {
             "ordered_stops": json.dumps(result.ordered_stops),
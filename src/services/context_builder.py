@@ -113,22 +113,18 @@ class ContextBuilder:
                             EXTRACT(EPOCH FROM (o.actual_eta - o.planned_eta)) / 60,
                             0
                         ) AS eta_drift_minutes,
-                        COALESCE(
-                            (SELECT p.top_risk_factors
-                             FROM predictions p
-                             WHERE p.order_id = o.id AND p.tenant_id = :tenant_id
-                             ORDER BY p.created_at DESC LIMIT 1),
-                            '[]'
-                        ) AS top_risk_factors,
-                        COALESCE(
-                            (SELECT p.predicted_delay_minutes
-                             FROM predictions p
-                             WHERE p.order_id = o.id AND p.tenant_id = :tenant_id
-                             ORDER BY p.created_at DESC LIMIT 1),
-                            0
-                        ) AS estimated_delay_minutes,
+                        COALESCE(latest.top_risk_factors, '[]') AS top_risk_factors,
+                        COALESCE(latest.predicted_delay_minutes, 0) AS estimated_delay_minutes,
                         o.last_decision
                     FROM orders o
+                    -- One lookup of the latest prediction per order feeds both columns.
+                    LEFT JOIN LATERAL (
+                        SELECT p.top_risk_factors, p.predicted_delay_minutes
+                        FROM predictions p
+                        WHERE p.order_id = o.id AND p.tenant_id = :tenant_id
+                        ORDER BY p.created_at DESC
+                        LIMIT 1
+                    ) latest ON TRUE
                     WHERE o.tenant_id = :tenant_id
                       AND o.status NOT IN ('completed', 'cancelled')
                       AND o.current_risk_score >= 0.50
@@ -15,6 +15,7 @@ Scheduling: Every 15 minutes (configurable via cron expression or interval)
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from enum import Enum
@@ -77,6 +78,33 @@ class ExecutiveSummaryService:
         tenant_id: str,
         summary_type: SummaryType,
         context_text: str,
+    ) -> Optional[ExecutiveSummary]:
+        summary = await self._generate(summary_type, context_text)
+        if summary:
+            await self._store(tenant_id, summary)
+        return summary
+
+    async def generate_all_types(
+        self,
+        tenant_id: str,
+        context_text: str,
+    ) -> list[ExecutiveSummary]:
+        # The LLM calls are independent, so issue them concurrently; the
+        # inserts share one AsyncSession and must stay sequential.
+        generated = await asyncio.gather(
+            *(self._generate(st, context_text) for st in SummaryType)
+        )
+        summaries = []
+        for summary in generated:
+            if summary:
+                await self._store(tenant_id, summary)
+                summaries.append(summary)
+        return summaries
+
+    async def _generate(
+        self,
+        summary_type: SummaryType,
+        context_text: str,
     ) -> Optional[ExecutiveSummary]:
         try:
             prompt = build_summary_prompt(context_text, summary_type.value)
@@ -91,7 +119,7 @@ class ExecutiveSummaryService:
             validated = validate_response(result.structured)
             if not validated:
                 return None
-            summary = ExecutiveSummary(
+            return ExecutiveSummary(
                 summary_type=summary_type,
                 summary_text=validated.summary,
                 confidence=validated.confidence,
@@ -103,28 +131,17 @@ class ExecutiveSummaryService:
                     "token_count": result.token_count_total,
                 },
             )
-            await self._store_in_db(tenant_id, summary)
-            self.logger.info(
-                "summary_stored",
-                type=summary_type.value,
-                confidence=summary.confidence,
-            )
-            return summary
         except Exception as e:
             self.logger.error("summary_generation_error", type=summary_type.value, error=str(e))
             return None
 
-    async def generate_all_types(
-        self,
-        tenant_id: str,
-        context_text: str,
-    ) -> list[ExecutiveSummary]:
-        summaries = []
-        for st in SummaryType:
-            summary = await self.generate_and_store(tenant_id, st, context_text)
-            if summary:
-                summaries.append(summary)
-        return summaries
+    async def _store(self, tenant_id: str, summary: ExecutiveSummary) -> None:
+        await self._store_in_db(tenant_id, summary)
+        self.logger.info(
+            "summary_stored",
+            type=summary.summary_type.value,
+            confidence=summary.confidence,
+        )
 
     async def _store_in_db(self, tenant_id: str, summary: ExecutiveSummary):
         try:
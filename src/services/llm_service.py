@@ -349,15 +349,20 @@ class GeminiService:
                         finally:
                             asyncio.run_coroutine_threadsafe(queue.put(StopIteration), loop).result()
 
-                    await loop.run_in_executor(None, _sync_producer)
+                    # Drain the queue while the producer thread is still
+                    # streaming, so chunks reach the client as they arrive.
+                    producer = loop.run_in_executor(None, _sync_producer)
 
                     while True:
                         item = await queue.get()
                         if item is StopIteration:
                             break
                         if item is None:
+                            # Re-raises the producer's own exception.
+                            await producer
                             raise RuntimeError("sync streaming failed")
                         yield item
+                    await producer
 
                     latency_ms = (time.time() - start_time) * 1000
                     self.logger.info("gemini_stream_complete", latency_ms=latency_ms)
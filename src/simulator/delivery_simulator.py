@@ -104,6 +104,7 @@ class DeliveryRoute:
     driver_slowness_factor: float = 1.0  # 1.0 or 1.2 for slow drivers
     weather_condition: Literal["clear", "rain", "heavy_rain"] = "clear"
     traffic_segments: List[int] = field(default_factory=list)  # Indices with traffic
+    leg_distances_km: List[float] = field(default_factory=list)  # Depot -> stops -> depot
 
 
 # ============================================================================
@@ -168,6 +169,23 @@ class DeliverySimulator:
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         return R * c
 
+    def _leg_distances(self, stop_locs: List[tuple]) -> List[float]:
+        """
+        Haversine distance (km) of every leg of a depot-to-depot tour.
+
+        Same formula as _distance_between_points, evaluated for all legs
+        (depot -> stop 1 -> ... -> stop N -> depot) in one NumPy pass.
+        """
+        depot = (self.DEPOT_LAT, self.DEPOT_LNG)
+        points = np.radians(np.array([depot, *stop_locs, depot], dtype=np.float64))
+        phi = points[:, 0]
+        delta = np.diff(points, axis=0)
+
+        a = np.sin(delta[:, 0] / 2) ** 2 + \
+            np.cos(phi[:-1]) * np.cos(phi[1:]) * np.sin(delta[:, 1] / 2) ** 2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return (6371 * c).tolist()
+
     def _bearing_between_points(self, lat1: float, lng1: float,
                                lat2: float, lng2: float) -> float:
         """
@@ -190,6 +208,8 @@ class DeliverySimulator:
         Returns list of (lat, lng) tuples.
         """
         stops = []
+        # Longitude degrees shrink with cos(latitude); the depot latitude is fixed.
+        km_per_lng_degree = 111.0 * math.cos(math.radians(self.DEPOT_LAT))
         for _ in range(num_stops):
             # Generate random point within ~50 km radius, roughly uniformly
             angle = random.uniform(0, 2 * math.pi)
@@ -198,8 +218,7 @@ class DeliverySimulator:
             
             # Approximate: 1 degree lat ≈ 111 km, 1 degree lng ≈ 111*cos(lat) km
             delta_lat = (distance_km / 111.0) * math.cos(angle)
-            delta_lng = (distance_km / (111.0 * math.cos(math.radians(self.DEPOT_LAT)))) * \
-                        math.sin(angle)
+            delta_lng = (distance_km / km_per_lng_degree) * math.sin(angle)
             
             lat = self.DEPOT_LAT + delta_lat
             lng = self.DEPOT_LNG + delta_lng
@@ -234,14 +253,11 @@ class DeliverySimulator:
         stop_locs = self._generate_stops(num_stops)
         
         # Calculate total distance and baseline duration
-        current_lat, current_lng = self.DEPOT_LAT, self.DEPOT_LNG
+        leg_distances = self._leg_distances(stop_locs)
         total_distance = 0.0
         route_stops = []
         
-        for idx, (stop_lat, stop_lng) in enumerate(stop_locs):
-            segment_dist = self._distance_between_points(
-                current_lat, current_lng, stop_lat, stop_lng
-            )
+        for idx, ((stop_lat, stop_lng), segment_dist) in enumerate(zip(stop_locs, leg_distances)):
             total_distance += segment_dist
             
             # Estimate time: 40 km/h average + stop time
@@ -255,13 +271,9 @@ class DeliverySimulator:
                 "eta_minutes": segment_time,
                 "stop_index": idx
             })
-            
-            current_lat, current_lng = stop_lat, stop_lng
         
         # Add return to depot
-        return_dist = self._distance_between_points(
-            current_lat, current_lng, self.DEPOT_LAT, self.DEPOT_LNG
-        )
+        return_dist = leg_distances[-1]
         total_distance += return_dist
         return_time = (return_dist / 40.0) * 60
         
@@ -302,7 +314,8 @@ class DeliverySimulator:
             total_duration_minutes=total_duration,
             driver_slowness_factor=slowness_factor,
             weather_condition=weather_cond.value,
-            traffic_segments=traffic_segments
+            traffic_segments=traffic_segments,
+            leg_distances_km=leg_distances,
         )
         
         return route
@@ -460,6 +473,10 @@ class DeliverySimulator:
         sequence_num = 0
         current_stop_idx = 0
         elapsed_time_sec = 0.0  # Track cumulative time in real-world seconds
+        # Reuse the leg distances computed when the route was planned.
+        leg_distances = route.leg_distances_km or self._leg_distances(
+            [(stop["lat"], stop["lng"]) for stop in route.stops]
+        )
         
         # Emit depot arrival event
         yield GPSPingEvent(
@@ -478,17 +495,13 @@ class DeliverySimulator:
         sequence_num += 1
         
         # Traverse each stop
-        for stop in route.stops:
+        for stop, segment_distance in zip(route.stops, leg_distances):
             stop_lat, stop_lng = stop["lat"], stop["lng"]
             stop_duration_min = random.uniform(self.STOP_DURATION_MIN_MIN,
                                               self.STOP_DURATION_MAX_MIN)
             stop_duration_min *= route.driver_slowness_factor
             
             # Travel to stop
-            segment_distance = self._distance_between_points(
-                current_lat, current_lng, stop_lat, stop_lng
-            )
-            
             # Determine speed (highway vs urban - infer from distance)
             if segment_distance > 5:  # Likely highway
                 target_speed = random.uniform(self.SPEED_HIGHWAY_MIN_KMH,
@@ -589,9 +602,7 @@ class DeliverySimulator:
             current_stop_idx += 1
         
         # Return to depot
-        return_distance = self._distance_between_points(
-            current_lat, current_lng, self.DEPOT_LAT, self.DEPOT_LNG
-        )
+        return_distance = leg_distances[-1]
         return_speed = random.uniform(self.SPEED_HIGHWAY_MIN_KMH,
                                      self.SPEED_HIGHWAY_MAX_KMH)
         return_time_sec = (return_distance / return_speed) * 3600
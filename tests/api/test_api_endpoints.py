@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from tests.conftest import count_queries
 from tests.fixtures.factories import OrderRequestFactory, PositionUpdateFactory
 
 
@@ -73,6 +74,10 @@ async def test_create_order_list_orders_and_position_update(api_client, auth_hea
     assert float(normalized_after["latitude"]) == update_payload["lat"]
     assert float(normalized_after["longitude"]) == update_payload["lng"]
 
+    stream_entries = await test_redis.xrange("gps_pings")
+    assert stream_entries[-1][1]["order_id"] == order_id
+    assert stream_entries[-1][1]["driver_id"] == order_request["driver_id"]
+
 
 @pytest.mark.asyncio
 async def test_get_prediction_uses_cached_order_state(api_client, auth_headers, test_redis) -> None:
@@ -101,3 +106,160 @@ async def test_get_prediction_uses_cached_order_state(api_client, auth_headers,
     assert 0 <= payload.get("riskScore", payload.get("risk_score")) <= 1
     assert isinstance(payload.get("topRiskFactors", payload.get("top_risk_factors")), list)
     assert payload.get("modelVersion", payload.get("model_version")) == "test-model-1"
+
+
+@pytest.mark.asyncio
+async def test_batch_predict_scores_live_orders_and_defaults_unknown(api_client, auth_headers, test_redis) -> None:
+    await test_redis.hset("prediction:order-cached", mapping={"risk_score": 0.9, "confidence": 0.9})
+    await test_redis.hset("order:order-live", mapping={"planned_stops": 5, "completed_stops": 2})
+
+    response = await api_client.post(
+        "/api/v1/predictions/batch",
+        json={"order_ids": ["order-cached", "order-live", "order-unknown"]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert list(payload) == ["order-cached", "order-live", "order-unknown"]
+    assert payload["order-cached"]["risk_score"] == pytest.approx(0.9)
+    assert payload["order-live"]["confidence"] == pytest.approx(0.75)
+    assert payload["order-unknown"]["confidence"] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_batch_predict_drops_only_malformed_live_orders(api_client, auth_headers, test_redis) -> None:
+    await test_redis.hset("order:order-good", mapping={"planned_stops": 5, "completed_stops": 2})
+    await test_redis.hset("order:order-garbled", mapping={"planned_stops": "five"})
+    await test_redis.hset("order:order-nan", mapping={"planned_stops": 5, "speed": "nan"})
+
+    response = await api_client.post(
+        "/api/v1/predictions/batch",
+        json={"order_ids": ["order-good", "order-garbled", "order-nan"]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["order-good"]["confidence"] == pytest.approx(0.75)
+    assert payload["order-garbled"]["confidence"] == pytest.approx(0.5)
+    assert payload["order-nan"]["confidence"] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_batch_predict_rejects_malformed_order_ids(api_client, auth_headers) -> None:
+    response = await api_client.post(
+        "/api/v1/predictions/batch",
+        json={"order_ids": "order-1"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_prediction_explanation_is_deferred(api_client, auth_headers, test_redis) -> None:
+    order_id = "order-explain-1"
+    await test_redis.hset(
+        f"order:{order_id}",
+        mapping={"planned_stops": 4, "completed_stops": 1, "driver_on_time_rate": 0.9},
+    )
+
+    response = await api_client.get(
+        f"/api/v1/predictions/{order_id}", params={"explain": "false"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload.get("topRiskFactors", payload.get("top_risk_factors")) == []
+    # A deferred response must not seed the cache that explain=true reads.
+    assert await test_redis.exists(f"prediction:{order_id}") == 0
+
+    explanation = await api_client.get(f"/api/v1/predictions/{order_id}/explanation", headers=auth_headers)
+    assert explanation.status_code == 200
+    assert explanation.json()["status"] == "ready"
+    assert isinstance(explanation.json()["topRiskFactors"], list)
+
+    # Explanations stored for another tenant are never served to this one.
+    await test_redis.set(
+        "explanation:other-tenant:order-foreign",
+        '{"status": "ready", "topRiskFactors": [{"feature": "speed_ratio"}]}',
+    )
+    foreign = await api_client.get("/api/v1/predictions/order-foreign/explanation", headers=auth_headers)
+    assert foreign.json()["status"] == "pending"
+    assert foreign.json()["topRiskFactors"] == []
+
+
+@pytest.mark.asyncio
+async def test_failed_explanation_is_reported_instead_of_pending(api_client, auth_headers, test_redis) -> None:
+    from src.api.routers.predictions import _store_explanation
+
+    class FailingService:
+        def predict_with_shap(self, order_id, features):
+            raise ValueError("shap exploded")
+
+    await _store_explanation(FailingService(), test_redis, "dev-tenant-id", "order-shap-fail", {})
+
+    explanation = await api_client.get("/api/v1/predictions/order-shap-fail/explanation", headers=auth_headers)
+    assert explanation.status_code == 200
+    assert explanation.json()["status"] == "failed"
+    assert explanation.json()["topRiskFactors"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_orders_keyset_cursor(api_client, auth_headers) -> None:
+    created_ids = []
+    for _ in range(3):
+        order_request = OrderRequestFactory()
+        order_request["plannedEta"] = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat()
+        response = await api_client.post("/api/v1/orders", json=order_request, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        created_ids.append(response.json()["orderId"])
+
+    first = await api_client.get("/api/v1/orders", params={"after_id": "", "page_size": 2}, headers=auth_headers)
+    assert first.status_code == 200
+    first_ids = [order.get("orderId", order.get("order_id")) for order in first.json()["items"]]
+    assert first_ids == sorted(first_ids)
+    assert len(first_ids) == 2
+    cursor = first.headers["X-Next-Cursor"]
+    assert cursor == first_ids[-1]
+
+    second = await api_client.get("/api/v1/orders", params={"after_id": cursor, "page_size": 2}, headers=auth_headers)
+    assert second.status_code == 200
+    second_ids = [order.get("orderId", order.get("order_id")) for order in second.json()["items"]]
+    assert all(order_id > cursor for order_id in second_ids)
+    assert not set(first_ids) & set(second_ids)
+
+
+@pytest.mark.asyncio
+async def test_list_orders_query_count_is_independent_of_page_size(api_client, auth_headers) -> None:
+    for _ in range(4):
+        order_request = OrderRequestFactory()
+        order_request["plannedEta"] = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat()
+        response = await api_client.post("/api/v1/orders", json=order_request, headers=auth_headers)
+        assert response.status_code == 200, response.text
+
+    query_counts = []
+    for page_size in (1, 4):
+        with count_queries(api_client.db_engine) as statements:
+            response = await api_client.get(
+                "/api/v1/orders", params={"page_size": page_size}, headers=auth_headers
+            )
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == page_size
+        query_counts.append(len(statements))
+
+    # COUNT + page query only; no per-order lookups.
+    assert query_counts == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_insights_metrics_reads_all_aggregates_in_two_queries(api_client, auth_headers) -> None:
+    order_request = OrderRequestFactory()
+    order_request["plannedEta"] = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat()
+    response = await api_client.post("/api/v1/orders", json=order_request, headers=auth_headers)
+    assert response.status_code == 200, response.text
+
+    with count_queries(api_client.db_engine) as statements:
+        response = await api_client.get("/api/v1/insights/metrics", headers=auth_headers)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["orders_processed"] == 1
+    # One summary row for orders/agent/prediction aggregates, one driver breakdown.
+    assert len(statements) == 2
@@ -29,11 +29,14 @@ os.environ.setdefault("REDIS_URL", "redis://localhost:6379")
 # Raise rate limit so performance tests (500 rapid requests) don't hit 429
 os.environ.setdefault("RATE_LIMIT_POSITION_PER_MINUTE", "100000")
 
+from contextlib import contextmanager
+
 import numpy as np
 import pytest
 import fakeredis.aioredis as fakeredis
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 
 # ---------------------------------------------------------------------------
@@ -56,7 +59,7 @@ class StubPredictionModel:
         self.score = score
 
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
-        return np.array([[1.0 - self.score, self.score]], dtype=float)
+        return np.tile([[1.0 - self.score, self.score]], (len(X), 1))
 
 
 class StubExplainer:
@@ -72,7 +75,14 @@ class _StubFeatureBuilder:
     """Minimal FeatureBuilder stand-in for StubPredictionService."""
     @staticmethod
     def build_from_live(order_state: dict, driver_stats: dict) -> dict[str, float]:
-        return {}
+        return {"current_speed_kmh": order_state["speed"]}
+
+    @staticmethod
+    def validate_features(features: dict[str, float]) -> bool:
+        for name, value in features.items():
+            if np.isnan(value):
+                raise ValueError(f"Feature {name} is NaN")
+        return True
 
 
 class StubPredictionResult:
@@ -101,10 +111,48 @@ class StubPredictionService:
         self.optimal_threshold = 0.7
         self.model_version = "test-model-1"
 
+    def warm_up(self, batch_size: int = 32) -> float:
+        return 0.0
+
+    def predict(self, order_id: str, features: dict[str, float]) -> StubPredictionResult:
+        return StubPredictionResult(order_id)
+
+    def predict_batch(
+        self, order_ids: list[str], features_list: list[dict[str, float]]
+    ) -> list[StubPredictionResult]:
+        return [StubPredictionResult(order_id) for order_id in order_ids]
+
     def predict_with_shap(self, order_id: str, features: dict[str, float]) -> StubPredictionResult:
         return StubPredictionResult(order_id)
 
 
+# ---------------------------------------------------------------------------
+# Query counting
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def count_queries(engine: AsyncEngine):
+    """Record every SQL statement executed on `engine` inside the block.
+
+    Used to pin endpoints to a fixed number of round-trips so a per-row
+    lookup (N+1) cannot creep back in unnoticed:
+
+        with count_queries(api_client.db_engine) as statements:
+            await api_client.get(...)
+        assert len(statements) == 2
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
 # ---------------------------------------------------------------------------
 # Core infrastructure fixtures
 # ---------------------------------------------------------------------------
@@ -313,6 +361,7 @@ async def api_client(test_redis):
     app.dependency_overrides[get_db] = _override_get_db
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        client.db_engine = test_engine  # for count_queries()
         yield client
 
     app.dependency_overrides.clear()
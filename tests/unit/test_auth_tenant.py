@@ -7,6 +7,10 @@ production). This test locks that contract in place.
 """
 import types
 
+import pytest
+from fastapi import HTTPException
+
+from src.api import auth
 from src.api.auth import get_current_tenant, get_current_tenant_ws
 
 
@@ -22,6 +26,75 @@ def test_rest_and_ws_agree_in_dev_mode():
     assert rest.tenant_id == "dev-tenant-id", "dev mode must use the single dev tenant"
 
 
+class _CountingTenantDB:
+    """AsyncSession stand-in returning a fixed tenants.is_active row."""
+
+    def __init__(self, is_active: bool) -> None:
+        self.is_active = is_active
+        self.calls = 0
+
+    async def execute(self, *args, **kwargs):
+        self.calls += 1
+        return types.SimpleNamespace(one_or_none=lambda: (self.is_active,))
+
+
+def test_active_tenant_lookup_is_cached():
+    auth._active_tenants.clear()
+    db = _CountingTenantDB(is_active=True)
+
+    _run(auth._ensure_tenant_active(db, "tenant-cached"))
+    _run(auth._ensure_tenant_active(db, "tenant-cached"))
+
+    assert db.calls == 1
+
+
+def test_inactive_tenant_is_not_cached():
+    auth._active_tenants.clear()
+    db = _CountingTenantDB(is_active=False)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            _run(auth._ensure_tenant_active(db, "tenant-inactive"))
+        assert exc_info.value.status_code == 401
+
+    assert db.calls == 2
+    assert "tenant-inactive" not in auth._active_tenants
+
+
+def test_averify_password_matches_sync_verify():
+    hashed = auth.hash_password("s3cret")
+
+    assert _run(auth.averify_password("s3cret", hashed)) is True
+    assert _run(auth.averify_password("wrong", hashed)) is False
+    assert _run(auth.averify_password("s3cret", "not-a-hash")) is False
+
+
+def test_access_token_decode_is_cached(monkeypatch):
+    auth._decoded_tokens.clear()
+    token = auth.jwt.encode(
+        {"sub": "tenant-a", "type": "access"}, "test-secret", algorithm=auth.ALGORITHM
+    )
+    calls = []
+    real_decode = auth.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+
+    first = auth._decode_token_cached(token, "test-secret")
+    second = auth._decode_token_cached(token, "test-secret")
+
+    assert first == second
+    assert first["sub"] == "tenant-a"
+    assert len(calls) == 1
+
+    # A different secret must not reuse the cached payload.
+    with pytest.raises(auth.JWTError):
+        auth._decode_token_cached(token, "other-secret")
+
+
 def _run(coro):
     import asyncio
 
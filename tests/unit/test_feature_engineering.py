@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.ml.feature_engineering import FeatureBuilder, FeatureStats
+from src.ml.feature_engineering import FeatureBuilder, FeatureStats, temporal_features
 
 from tests.fixtures.factories import HistoricalDeliveryFactory, LiveOrderStateFactory
 
@@ -63,7 +63,84 @@ def test_compute_feature_stats_and_impute_features() -> None:
     assert isinstance(stats, FeatureStats)
     assert len(stats.feature_medians) == 14
 
+    per_row = pd.DataFrame([builder.build_from_historical(row) for _, row in df.iterrows()])
+    for name in builder.get_feature_names():
+        assert stats.feature_medians[name] == pytest.approx(per_row[name].median())
+        assert stats.feature_mins[name] == pytest.approx(per_row[name].min())
+        assert stats.feature_maxs[name] == pytest.approx(per_row[name].max())
+
+    # A corrupt row must not pull the progress features towards clamped values.
+    corrupt = pd.DataFrame([HistoricalDeliveryFactory(completed_stops=np.nan)])
+    with_corrupt = builder.compute_feature_stats(pd.concat([df, corrupt], ignore_index=True))
+    for name in ("stops_remaining_ratio", "pace_ratio"):
+        assert with_corrupt.feature_medians[name] == pytest.approx(stats.feature_medians[name])
+        assert with_corrupt.feature_mins[name] == pytest.approx(stats.feature_mins[name])
+        assert with_corrupt.feature_maxs[name] == pytest.approx(stats.feature_maxs[name])
+
     features = {name: np.nan if index % 2 == 0 else 0.7 for index, name in enumerate(builder.get_feature_names())}
     imputed = builder.impute_features(features, stats)
 
     assert all(not pd.isna(value) for value in imputed.values())
+
+
+def test_temporal_features_are_memoized_and_match_live_features() -> None:
+    temporal_features.cache_clear()
+    builder = FeatureBuilder()
+    state = {**LiveOrderStateFactory(), "hour_of_day": 8, "day_of_week": 3}
+
+    first = builder.build_from_live(state, {"driver_on_time_rate": 0.9})
+    second = builder.build_from_live(state, {"driver_on_time_rate": 0.9})
+
+    assert first == second
+    assert first["is_peak_hour"] == 1.0
+    assert temporal_features.cache_info().hits >= 1
+    assert temporal_features(8, 3) == (
+        first["hour_of_day_sin"],
+        first["hour_of_day_cos"],
+        first["is_peak_hour"],
+        first["day_of_week_sin"],
+        first["day_of_week_cos"],
+    )
+
+
+def test_build_matrix_from_historical_matches_per_row_builder() -> None:
+    builder = FeatureBuilder()
+    records = [
+        HistoricalDeliveryFactory(),
+        HistoricalDeliveryFactory(completed_stops=3, actual_duration_minutes=400.0, hour_of_day_start=8),
+        HistoricalDeliveryFactory(planned_stops=0, completed_stops=0, avg_speed_kmh=12.5, day_of_week=6),
+    ]
+    df = pd.DataFrame(records)
+
+    matrix = builder.build_matrix_from_historical(df)
+    expected = np.array(
+        [list(builder.build_from_historical(row).values()) for _, row in df.iterrows()]
+    )
+
+    assert matrix.shape == (3, len(builder.get_feature_names()))
+    assert matrix.dtype == np.float32
+    assert matrix.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(matrix, expected, rtol=1e-6, atol=1e-6)
+    assert builder.validate_matrix(matrix) is True
+
+    matrix[1, 4] = np.nan
+    with pytest.raises(ValueError, match="current_speed_kmh .* is NaN"):
+        builder.validate_matrix(matrix)
+
+
+def test_build_matrix_from_historical_keeps_nan_inputs_visible() -> None:
+    builder = FeatureBuilder()
+    df = pd.DataFrame([
+        HistoricalDeliveryFactory(),
+        HistoricalDeliveryFactory(completed_stops=np.nan),
+        HistoricalDeliveryFactory(actual_duration_minutes=np.nan),
+    ])
+
+    matrix = builder.build_matrix_from_historical(df)
+    names = builder.get_feature_names()
+
+    assert np.isnan(matrix[1, names.index("stops_remaining_ratio")])
+    assert np.isnan(matrix[1, names.index("pace_ratio")])
+    assert np.isnan(matrix[2, names.index("time_elapsed_ratio")])
+    with pytest.raises(ValueError, match=r"stops_remaining_ratio .* is NaN \(row 1\)"):
+        builder.validate_matrix(matrix)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
+
 import numpy as np
 import pytest
+from cachetools import LRUCache
 
 from src.ml.feature_engineering import FeatureBuilder, FeatureStats
 from src.ml.inference import PredictionResult, PredictionService
@@ -68,6 +71,27 @@ def test_predict_with_shap_returns_sorted_factors() -> None:
     assert any(factor["direction"] == "increases_risk" for factor in result.top_risk_factors)
 
 
+def test_predict_batch_scores_all_orders_in_one_call() -> None:
+    service = build_service()
+    features = FeatureBuilder().build_from_live(LiveOrderStateFactory(), {"driver_on_time_rate": 0.9})
+
+    results = service.predict_batch(["order-1", "order-2", "order-3"], [features] * 3)
+
+    assert [result.order_id for result in results] == ["order-1", "order-2", "order-3"]
+    single = service.predict("order-1", features)
+    for result in results:
+        assert result.risk_score == pytest.approx(single.risk_score)
+        assert result.predicted_delay_minutes == pytest.approx(single.predicted_delay_minutes)
+        assert result.top_risk_factors == []
+
+
+def test_predict_batch_rejects_invalid_features() -> None:
+    service = build_service()
+
+    with pytest.raises(ValueError, match="Invalid features for order order-2"):
+        service.predict_batch(["order-2"], [{"stops_remaining_ratio": 0.5}])
+
+
 def test_extract_top_factors_handles_top_k() -> None:
     service = build_service()
     features = FeatureBuilder().build_from_live(LiveOrderStateFactory(), {"driver_on_time_rate": 0.9})
@@ -77,3 +101,75 @@ def test_extract_top_factors_handles_top_k() -> None:
 
     assert len(factors) == 3
     assert factors[0]["contribution"] >= factors[1]["contribution"] >= factors[2]["contribution"]
+
+
+def test_build_feature_vector_follows_model_feature_order() -> None:
+    service = build_service()
+    features = {name: float(index) for index, name in enumerate(reversed(service.feature_names))}
+
+    X = service._build_feature_vector(features)
+
+    assert X.shape == (1, len(service.feature_names))
+    assert X.dtype == np.float32
+    assert X[0].tolist() == [features[name] for name in service.feature_names]
+
+
+def test_booster_scores_match_sklearn_predict_proba() -> None:
+    xgb = pytest.importorskip("xgboost")
+    rng = np.random.default_rng(0)
+    service = build_service()
+    X = rng.random((64, len(service.feature_names)), dtype=np.float32)
+    y = (X[:, 0] + 0.2 * rng.random(64) > 0.6).astype(int)
+    model = xgb.XGBClassifier(n_estimators=10, max_depth=3, tree_method="hist", verbosity=0)
+    model.fit(X, y)
+
+    service.model = model
+    service._booster = model.get_booster()
+
+    np.testing.assert_allclose(service._risk_scores(X), model.predict_proba(X)[:, 1], rtol=1e-6)
+
+
+def test_score_cache_only_runs_model_on_unseen_rows() -> None:
+    service = build_service(score=0.3)
+    calls: list[int] = []
+    model = service.model
+
+    class CountingModel:
+        def predict_proba(self, X: np.ndarray) -> np.ndarray:
+            calls.append(len(X))
+            return model.predict_proba(X)
+
+    service.model = CountingModel()
+    service._score_cache = LRUCache(maxsize=16)
+    service._score_cache_lock = threading.Lock()
+    X = np.array([[0.1] * 14, [0.2] * 14], dtype=np.float32)
+
+    first = service._risk_scores(X)
+    second = service._risk_scores(np.vstack([X, np.full((1, 14), 0.3, dtype=np.float32)]))
+
+    assert calls == [2, 1]
+    np.testing.assert_allclose(second[:2], first)
+    assert second.tolist() == pytest.approx([0.3, 0.3, 0.3])
+
+
+def test_warm_up_scores_a_batch_without_filling_the_score_cache() -> None:
+    service = build_service()
+    calls: list[np.ndarray] = []
+    model = service.model
+
+    class RecordingModel:
+        def predict_proba(self, X: np.ndarray) -> np.ndarray:
+            calls.append(X)
+            return model.predict_proba(X)
+
+    service.model = RecordingModel()
+    service._score_cache = LRUCache(maxsize=16)
+    service._score_cache_lock = threading.Lock()
+
+    latency_ms = service.warm_up(batch_size=8)
+
+    assert latency_ms >= 0
+    assert len(calls) == 1
+    assert calls[0].shape == (8, 14)
+    assert calls[0].dtype == np.float32
+    assert len(service._score_cache) == 0
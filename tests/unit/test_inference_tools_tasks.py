@@ -132,11 +132,10 @@ async def test_send_customer_notification_timeout() -> None:
 @pytest.mark.asyncio
 async def test_update_order_eta_publishes_events() -> None:
     db_session = AsyncMock()
-    db_session.execute.return_value = SimpleNamespace(rowcount=1)
+    db_session.execute.return_value = SimpleNamespace(scalar_one_or_none=lambda: "tenant-777")
     db_session.commit = AsyncMock()
 
     redis_client = AsyncMock()
-    redis_client.get = AsyncMock(return_value=b"tenant-777")
     redis_client.publish = AsyncMock()
 
     result = await update_order_eta(
@@ -150,6 +149,8 @@ async def test_update_order_eta_publishes_events() -> None:
     assert result is True
     db_session.commit.assert_awaited_once()
     assert redis_client.publish.await_count == 2
+    # Tenant comes from UPDATE ... RETURNING, not a Redis lookup.
+    redis_client.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -245,7 +246,7 @@ def test_celery_task_success(monkeypatch: pytest.MonkeyPatch) -> None:
                 solver_duration_ms=18,
             )
 
-    monkeypatch.setattr("redis.Redis.from_url", lambda *args, **kwargs: fake_redis)
+    monkeypatch.setattr("src.optimization.tasks._get_sync_redis", lambda: fake_redis)
     monkeypatch.setattr("src.optimization.tasks.VRPSolver", lambda timeout_seconds=5: FakeSolver())
     monkeypatch.setattr("src.optimization.tasks.get_shipment_updates_channel", lambda: "shipment-updates")
 
@@ -274,7 +275,7 @@ def test_celery_task_soft_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
         def solve(self, problem: RoutingProblem) -> RoutingResult:
             raise SoftTimeLimitExceeded()
 
-    monkeypatch.setattr("redis.Redis.from_url", lambda *args, **kwargs: fake_redis)
+    monkeypatch.setattr("src.optimization.tasks._get_sync_redis", lambda: fake_redis)
     monkeypatch.setattr("src.optimization.tasks.VRPSolver", lambda timeout_seconds=5: TimeoutSolver())
     monkeypatch.setattr("src.optimization.tasks.get_shipment_updates_channel", lambda: "shipment-updates")
 
@@ -302,7 +303,7 @@ def test_celery_task_retry_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
     class RetryRaised(Exception):
         pass
 
-    monkeypatch.setattr("redis.Redis.from_url", lambda *args, **kwargs: fake_redis)
+    monkeypatch.setattr("src.optimization.tasks._get_sync_redis", lambda: fake_redis)
     monkeypatch.setattr("src.optimization.tasks.VRPSolver", lambda timeout_seconds=5: ErrorSolver())
     monkeypatch.setattr("src.optimization.tasks.get_shipment_updates_channel", lambda: "shipment-updates")
 
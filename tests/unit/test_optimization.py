@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from datetime import datetime, timedelta
 
 import pytest
 
-from src.optimization.service import JobStatus, OptimizationService
-from src.optimization.solver import RoutingProblem, RoutingStop, haversine_distance, get_time_matrix
+from src.optimization import service as service_module
+from src.optimization import solver as solver_module
+from src.optimization.service import MAX_INLINE_SOLVES_PER_TENANT, JobStatus, OptimizationService
+from src.optimization.solver import (
+    RoutingProblem,
+    RoutingStop,
+    VRPSolver,
+    get_distance_matrix,
+    get_time_matrix,
+    haversine_distance,
+)
 
 
 def test_haversine_and_time_matrix_helpers() -> None:
@@ -15,6 +26,75 @@ def test_haversine_and_time_matrix_helpers() -> None:
     matrix = get_time_matrix([[0, 1000], [1000, 0]])
     assert matrix[0][1] > 0
 
+    distances = [[0, 5, 1000, 123457], [5, 0, 250, 9999], [1000, 250, 0, 42], [123457, 9999, 42, 0]]
+    speed_m_per_sec = 40 * 1000 / 3600
+    assert get_time_matrix(distances) == [
+        [max(1, int(d / speed_m_per_sec)) for d in row] for row in distances
+    ]
+    assert all(isinstance(t, int) for row in get_time_matrix(distances) for t in row)
+
+
+def test_distance_matrix_matches_scalar_haversine() -> None:
+    origin = (40.7128, -74.0060)
+    stops = [
+        RoutingStop(stop_id="a", lat=40.7228, lng=-74.0020),
+        RoutingStop(stop_id="b", lat=40.7328, lng=-73.9960),
+        RoutingStop(stop_id="c", lat=40.6928, lng=-73.9860),
+    ]
+    locations = [origin] + [(s.lat, s.lng) for s in stops]
+
+    matrix = get_distance_matrix(origin[0], origin[1], stops)
+
+    assert len(matrix) == len(locations)
+    for i, (lat1, lng1) in enumerate(locations):
+        assert matrix[i][i] == 0
+        for j, (lat2, lng2) in enumerate(locations):
+            expected = int(haversine_distance(lat1, lng1, lat2, lng2) * 1.3)
+            assert abs(matrix[i][j] - expected) <= 1
+            assert isinstance(matrix[i][j], int)
+
+
+@pytest.fixture
+def empty_solution_cache():
+    """Start with an empty solver cache and leave none of this test's entries behind."""
+    solver_module._solution_cache.clear()
+    yield solver_module._solution_cache
+    solver_module._solution_cache.clear()
+
+
+def test_solver_reuses_solution_for_identical_problem(monkeypatch, empty_solution_cache) -> None:
+    problem = RoutingProblem(
+        origin=(40.7128, -74.0060),
+        stops=[
+            RoutingStop(stop_id="a", lat=40.7228, lng=-74.0020),
+            RoutingStop(stop_id="b", lat=40.7328, lng=-73.9960),
+            RoutingStop(stop_id="c", lat=40.6928, lng=-73.9860),
+        ],
+    )
+    matrix_builds = []
+    real_distance_matrix = solver_module._distance_matrix_array
+
+    def counting_distance_matrix(*args, **kwargs):
+        matrix_builds.append(args)
+        return real_distance_matrix(*args, **kwargs)
+
+    monkeypatch.setattr(solver_module, "_distance_matrix_array", counting_distance_matrix)
+
+    first = VRPSolver(timeout_seconds=1).solve(problem)
+    assert first.solver_status == "feasible"
+    assert len(matrix_builds) == 1
+
+    second = VRPSolver(timeout_seconds=1).solve(problem)
+    assert len(matrix_builds) == 1
+    assert second.solver_status == "feasible"
+    assert second.ordered_stops == first.ordered_stops
+    assert second.total_distance_km == first.total_distance_km
+
+    moved = RoutingProblem(origin=(40.7000, -74.0060), stops=problem.stops)
+    assert VRPSolver(timeout_seconds=1).solve(moved).solver_status == "feasible"
+    assert len(matrix_builds) == 2
+    assert len(empty_solution_cache) == 2
+
 
 @pytest.mark.asyncio
 async def test_optimization_job_lifecycle(test_redis) -> None:
@@ -41,3 +121,41 @@ async def test_optimization_job_lifecycle(test_redis) -> None:
 
     active_jobs = await service.get_active_jobs_for_tenant("tenant-1")
     assert active_jobs == []
+
+
+@pytest.mark.asyncio
+async def test_inline_solves_are_bounded_per_tenant(test_redis, monkeypatch) -> None:
+    service = OptimizationService(test_redis)
+    lock = threading.Lock()
+    release = threading.Event()
+    in_flight = {"now": 0, "peak": 0}
+
+    def blocking_solve(problem):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        release.wait(timeout=5)
+        with lock:
+            in_flight["now"] -= 1
+        return problem
+
+    monkeypatch.setattr(service.solver, "solve", blocking_solve)
+    problem = RoutingProblem(origin=(40.7128, -74.0060), stops=[])
+    keys = [f"optimization:job:burst-{i}" for i in range(2 * MAX_INLINE_SOLVES_PER_TENANT)]
+    for key in keys:
+        await test_redis.hset(key, mapping={"status": JobStatus.PENDING.value})
+
+    jobs = [asyncio.create_task(service._solve_inline(key, "tenant-burst", problem)) for key in keys]
+    while in_flight["now"] < MAX_INLINE_SOLVES_PER_TENANT:
+        await asyncio.sleep(0.01)
+
+    # Jobs waiting for a slot are still reported as pending.
+    statuses = [await test_redis.hget(key, "status") for key in keys]
+    assert statuses.count(JobStatus.RUNNING.value) == MAX_INLINE_SOLVES_PER_TENANT
+    assert statuses.count(JobStatus.PENDING.value) == len(keys) - MAX_INLINE_SOLVES_PER_TENANT
+
+    release.set()
+    await asyncio.gather(*jobs)
+
+    assert in_flight["peak"] == MAX_INLINE_SOLVES_PER_TENANT
+    assert "tenant-burst" not in service_module._inline_solve_slots
@@ -104,3 +104,19 @@ def test_simulator_is_deterministic_with_same_seed():
     # Compare key numeric columns
     assert df_a["actual_duration_minutes"].tolist() == df_b["actual_duration_minutes"].tolist()
     assert df_a["was_late"].tolist() == df_b["was_late"].tolist()
+
+
+def test_planned_leg_distances_match_scalar_haversine():
+    sim = DeliverySimulator(seed=7, tenant_id="test-tenant")
+    route = sim._plan_route(num_stops=4)
+
+    points = [(sim.DEPOT_LAT, sim.DEPOT_LNG)]
+    points += [(stop["lat"], stop["lng"]) for stop in route.stops]
+    points.append((sim.DEPOT_LAT, sim.DEPOT_LNG))
+    expected = [
+        sim._distance_between_points(*start, *end)
+        for start, end in zip(points, points[1:])
+    ]
+
+    assert route.leg_distances_km == pytest.approx(expected)
+    assert route.total_distance_km == pytest.approx(sum(expected))
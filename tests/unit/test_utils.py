@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import logging
+
+import structlog
+
 from src.api.routers.orders import _get_risk_level
 from src.api.routers.predictions import _confidence_to_score
+from src.core.log_config import configure_logging
 from src.db.redis_schema import (
     get_features_key,
     get_fleet_positions_key,
@@ -26,3 +31,27 @@ def test_confidence_and_risk_mappings_are_consistent() -> None:
     assert _get_risk_level(0.1).value == "low"
     assert _get_risk_level(0.5).value == "medium"
     assert _get_risk_level(0.9).value == "high"
+
+
+def test_configure_logging_drops_events_below_level(capsys) -> None:
+    root = logging.getLogger()
+    saved_root = (root.level, root.handlers[:])
+    saved_asyncio_level = logging.getLogger("asyncio").level
+    try:
+        configure_logging("production", "warning")
+        logger = structlog.get_logger("test")
+
+        logger.info("suppressed_event")
+        logger.warning("kept_event")
+    finally:
+        structlog.reset_defaults()
+        for handler in root.handlers:
+            if handler not in saved_root[1]:
+                handler.close()
+        root.setLevel(saved_root[0])
+        root.handlers[:] = saved_root[1]
+        logging.getLogger("asyncio").setLevel(saved_asyncio_level)
+
+    output = capsys.readouterr().out
+    assert "suppressed_event" not in output
+    assert "kept_event" in output